@@ -5,7 +5,7 @@ This example demonstrates how to extract named entities from text using LLMs.
 """
 
 from src.text_extractor import TextExtractor
-import json
+from examples.helpers import print_json
 
 
 def main():
@@ -27,7 +27,7 @@ def main():
 
     entities = extractor.extract_entities(news_text)
     print("\nExtracted Entities:")
-    print(json.dumps(entities, indent=2))
+    print_json(entities)
 
     # Example 2: Business email
     print("\n" + "=" * 60)
@@ -49,7 +49,7 @@ def main():
 
     entities = extractor.extract_entities(email_text)
     print("\nExtracted Entities:")
-    print(json.dumps(entities, indent=2))
+    print_json(entities)
 
     # Example 3: Custom entity types
     print("\n" + "=" * 60)
@@ -66,7 +66,7 @@ def main():
         custom_text, entity_types=["products", "companies", "numbers"]
     )
     print("\nExtracted Entities (Custom Types):")
-    print(json.dumps(custom_entities, indent=2))
+    print_json(custom_entities)
 
     # Example 4: Medical text
     print("\n" + "=" * 60)
@@ -84,7 +84,7 @@ def main():
         entity_types=["people", "organizations", "dates", "medications", "symptoms"],
     )
     print("\nExtracted Entities:")
-    print(json.dumps(medical_entities, indent=2))
+    print_json(medical_entities)
 
 
 if __name__ == "__main__":
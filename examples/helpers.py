@@ -0,0 +1,52 @@
+"""
+Shared helpers for the example scripts.
+"""
+
+import functools
+import sys
+from pathlib import Path
+from typing import Any
+
+from src.utils import json_utils
+
+SAMPLE_DOCUMENTS = Path(__file__).resolve().parent.parent / "data" / "sample_documents"
+
+
+@functools.lru_cache(maxsize=None)
+def load_fixture(name: str) -> str:
+    """
+    Load a sample document, reading each file from disk only once.
+
+    Args:
+        name: File name inside data/sample_documents
+
+    Returns:
+        Document text
+    """
+    return (SAMPLE_DOCUMENTS / name).read_text(encoding="utf-8")
+
+
+def print_json(obj: Any) -> None:
+    """
+    Pretty-print an object as JSON on stdout.
+
+    With orjson installed the encoded bytes are written straight to the
+    stdout buffer, skipping the str round trip through the text layer.
+
+    Args:
+        obj: JSON-serializable object
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if json_utils.orjson is None or buffer is None:
+        print(json_utils.to_json(obj, indent=True))
+        return
+
+    # Push pending text output first so the JSON appears in order
+    sys.stdout.flush()
+    buffer.write(
+        json_utils.orjson.dumps(
+            obj,
+            option=json_utils.orjson.OPT_INDENT_2
+            | json_utils.orjson.OPT_APPEND_NEWLINE,
+        )
+    )
@@ -5,7 +5,7 @@ This example demonstrates how to analyze sentiment and emotional tone of text.
 """
 
 from src.text_extractor import TextExtractor
-import json
+from examples.helpers import print_json
 
 
 def main():
@@ -26,7 +26,7 @@ def main():
 
     sentiment1 = extractor.analyze_sentiment(review1)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment1, indent=2))
+    print_json(sentiment1)
 
     # Example 2: Product review (negative)
     print("\n" + "=" * 60)
@@ -42,7 +42,7 @@ def main():
 
     sentiment2 = extractor.analyze_sentiment(review2)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment2, indent=2))
+    print_json(sentiment2)
 
     # Example 3: News article (neutral)
     print("\n" + "=" * 60)
@@ -59,7 +59,7 @@ def main():
 
     sentiment3 = extractor.analyze_sentiment(news)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment3, indent=2))
+    print_json(sentiment3)
 
     # Example 4: Social media post (mixed)
     print("\n" + "=" * 60)
@@ -76,7 +76,7 @@ def main():
 
     sentiment4 = extractor.analyze_sentiment(social_post)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment4, indent=2))
+    print_json(sentiment4)
 
     # Example 5: Customer feedback
     print("\n" + "=" * 60)
@@ -92,7 +92,7 @@ def main():
 
     sentiment5 = extractor.analyze_sentiment(feedback)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment5, indent=2))
+    print_json(sentiment5)
 
     # Example 6: Email communication
     print("\n" + "=" * 60)
@@ -114,7 +114,7 @@ def main():
 
     sentiment6 = extractor.analyze_sentiment(email)
     print("\nSentiment Analysis:")
-    print(json.dumps(sentiment6, indent=2))
+    print_json(sentiment6)
 
 
 if __name__ == "__main__":
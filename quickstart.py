@@ -7,11 +7,9 @@ Make sure you have set up your .env file with API keys before running.
 """
 
 import os
-from dotenv import load_dotenv
-from src.text_extractor import TextExtractor
 
-# Load environment variables
-load_dotenv()
+# Importing the package loads the .env file
+from src.text_extractor import TextExtractor
 
 
 def check_api_keys():
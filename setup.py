@@ -8,7 +8,10 @@ with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
 with open("requirements.txt", "r", encoding="utf-8") as fh:
-    requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+    # Drop comments, including trailing ones such as "tenacity>=8.2.0  # ..."
+    requirements = [
+        line.split("#", 1)[0].strip() for line in fh if line.split("#", 1)[0].strip()
+    ]
 
 setup(
     name="llm-text-extraction",
@@ -3,22 +3,122 @@ Specialized invoice and receipt extraction module.
 """
 
 import json
-from typing import Dict, Any, Optional
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from ..text_extractor import TextExtractor
+from ..utils.json_utils import parse_llm_json, to_json
+from ..utils.text_utils import estimate_tokens
+
+_INVOICE_SCHEMA = {
+    "invoice_number": "string",
+    "invoice_date": "string (YYYY-MM-DD format)",
+    "due_date": "string (YYYY-MM-DD format)",
+    "vendor": {
+        "name": "string",
+        "address": "string",
+        "phone": "string",
+        "email": "string",
+    },
+    "customer": {
+        "name": "string",
+        "address": "string",
+        "phone": "string",
+        "email": "string",
+    },
+    "line_items": [
+        {
+            "description": "string",
+            "quantity": "number",
+            "unit_price": "number",
+            "total": "number",
+        }
+    ],
+    "subtotal": "number",
+    "tax": "number",
+    "tax_rate": "number (percentage)",
+    "total": "number",
+    "currency": "string (ISO code like USD, EUR)",
+    "payment_terms": "string",
+    "payment_method": "string",
+    "notes": "string",
+}
+
+# Serialized once so every request embeds a byte-identical schema
+_INVOICE_SCHEMA_JSON = to_json(_INVOICE_SCHEMA, indent=True)
+
+# Token budget for packing several invoices into one extract_batch request.
+# The output budget caps how many invoices fit in a single response.
+_BATCH_INPUT_TOKENS = 6000
+_BATCH_OUTPUT_TOKENS_PER_INVOICE = 800
+_BATCH_MAX_OUTPUT_TOKENS = 4000
+
+_BATCH_INSTRUCTIONS = f"""Extract structured data from each invoice in the user message according to the provided schema.
+
+Schema:
+{_INVOICE_SCHEMA_JSON}
+
+Return ONLY a JSON object of the form {{"invoices": [...]}}, where invoices[i] is the data for INVOICE i, with one entry per invoice in the same order."""
+
+# Static instructions are sent as a cached prompt prefix; only the invoice
+# text varies between calls.
+_LINE_ITEMS_INSTRUCTIONS = """Extract all line items from the invoice in the user message.
+
+Return ONLY a JSON object whose "line_items" array holds each line item with:
+- description
+- quantity
+- unit_price
+- total
+
+Format:
+{
+  "line_items": [
+    {
+      "description": "Item name",
+      "quantity": 2,
+      "unit_price": 50.00,
+      "total": 100.00
+    }
+  ]
+}"""
+
+# Fields that must be present and non-empty for an invoice to be valid
+_REQUIRED_INVOICE_FIELDS = ("invoice_number", "total", "vendor", "customer")
+
+
+def _amounts_match(calculated: float, reported: float) -> bool:
+    """
+    Check whether two monetary amounts agree to within one cent.
+
+    Args:
+        calculated: Amount computed from the invoice data
+        reported: Amount stated on the invoice
+
+    Returns:
+        True if the amounts differ by at most 0.01
+    """
+    return math.isclose(calculated, reported, rel_tol=0.0, abs_tol=0.01)
 
 
 class InvoiceExtractor:
     """Extract structured data from invoices and receipts."""
 
-    def __init__(self, provider: str = None, api_key: str = None):
+    def __init__(
+        self,
+        provider: str = None,
+        api_key: str = None,
+        extractor: Optional[TextExtractor] = None,
+    ):
         """
         Initialize InvoiceExtractor.
 
         Args:
             provider: LLM provider name
             api_key: API key for the provider
+            extractor: Preconstructed TextExtractor to reuse; provider and
+                api_key are ignored when given
         """
-        self.extractor = TextExtractor(provider=provider, api_key=api_key)
+        self.extractor = extractor or TextExtractor(provider=provider, api_key=api_key)
 
     def extract(self, invoice_text: str) -> Dict[str, Any]:
         """
@@ -30,93 +130,121 @@ class InvoiceExtractor:
         Returns:
             Dictionary with extracted invoice data
         """
-        schema = {
-            "invoice_number": "string",
-            "invoice_date": "string (YYYY-MM-DD format)",
-            "due_date": "string (YYYY-MM-DD format)",
-            "vendor": {
-                "name": "string",
-                "address": "string",
-                "phone": "string",
-                "email": "string",
-            },
-            "customer": {
-                "name": "string",
-                "address": "string",
-                "phone": "string",
-                "email": "string",
-            },
-            "line_items": [
-                {
-                    "description": "string",
-                    "quantity": "number",
-                    "unit_price": "number",
-                    "total": "number",
-                }
-            ],
-            "subtotal": "number",
-            "tax": "number",
-            "tax_rate": "number (percentage)",
-            "total": "number",
-            "currency": "string (ISO code like USD, EUR)",
-            "payment_terms": "string",
-            "payment_method": "string",
-            "notes": "string",
-        }
+        return self.extractor.extract_structured_data(
+            invoice_text, _INVOICE_SCHEMA_JSON
+        )
 
-        return self.extractor.extract_structured_data(invoice_text, schema)
+    def extract_batch(
+        self, invoice_texts: List[str], max_workers: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract structured information from several invoices.
 
-    def extract_line_items(self, invoice_text: str) -> list:
+        Small invoices are packed into shared requests that each fit the
+        batch token budget, so K invoices cost one round trip and one copy of
+        the schema instead of K. The packed requests run concurrently.
+
+        Args:
+            invoice_texts: Raw invoice texts
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List of extracted invoice data, in the same order as invoice_texts
         """
-        Extract only line items from invoice.
+        if not invoice_texts:
+            return []
+
+        groups = self._pack_batches(invoice_texts)
+        workers = min(max_workers, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._extract_group, groups)
+            return [data for group in results for data in group]
+
+    @staticmethod
+    def _pack_batches(invoice_texts: List[str]) -> List[List[str]]:
+        """
+        Split invoices into consecutive groups that fit one request.
 
         Args:
-            invoice_text: Raw invoice text
+            invoice_texts: Raw invoice texts
 
         Returns:
-            List of line items
+            Groups of invoice texts, in input order
         """
-        prompt = f"""Extract all line items from this invoice.
+        max_group = _BATCH_MAX_OUTPUT_TOKENS // _BATCH_OUTPUT_TOKENS_PER_INVOICE
+        groups = []
+        group = []
+        group_tokens = 0
+
+        for text in invoice_texts:
+            tokens = estimate_tokens(text)
+            if group and (
+                group_tokens + tokens > _BATCH_INPUT_TOKENS or len(group) >= max_group
+            ):
+                groups.append(group)
+                group = []
+                group_tokens = 0
+            group.append(text)
+            group_tokens += tokens
+
+        groups.append(group)
+        return groups
+
+    def _extract_group(self, invoice_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract a group of invoices with a single request.
 
-Invoice:
-{invoice_text}
+        Falls back to one request per invoice if the combined response does
+        not contain exactly one result per invoice.
 
-Return ONLY a JSON array of line items with:
-- description
-- quantity
-- unit_price
-- total
+        Args:
+            invoice_texts: Raw invoice texts
 
-Format:
-[
-  {{
-    "description": "Item name",
-    "quantity": 2,
-    "unit_price": 50.00,
-    "total": 100.00
-  }}
-]"""
-
-        response = self.extractor.provider.complete(
-            prompt, temperature=0.1, max_tokens=1500
+        Returns:
+            List of extracted invoice data, in the same order as invoice_texts
+        """
+        if len(invoice_texts) == 1:
+            return [self.extract(invoice_texts[0])]
+
+        prompt = "\n\n".join(
+            f"INVOICE {i}:\n{text}" for i, text in enumerate(invoice_texts)
+        )
+        # Sample as extract() does, so batching never changes the results
+        response = self.extractor.provider.complete_json(
+            prompt,
+            temperature=self.extractor.temperature,
+            max_tokens=_BATCH_OUTPUT_TOKENS_PER_INVOICE * len(invoice_texts),
+            cached_prefix=_BATCH_INSTRUCTIONS,
         )
 
         try:
-            items = json.loads(response)
-            return items
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return []
+            invoices = parse_llm_json(response, {}).get("invoices")
+        except (json.JSONDecodeError, AttributeError):
+            invoices = None
+
+        if isinstance(invoices, list) and len(invoices) == len(invoice_texts):
+            return invoices
+        return [self.extract(text) for text in invoice_texts]
+
+    def extract_line_items(self, invoice_text: str) -> list:
+        """
+        Extract only line items from invoice.
+
+        Args:
+            invoice_text: Raw invoice text
+
+        Returns:
+            List of line items
+        """
+        response = self.extractor.provider.complete_json(
+            f"Invoice:\n{invoice_text}",
+            temperature=0.0,
+            max_tokens=1500,
+            cached_prefix=_LINE_ITEMS_INSTRUCTIONS,
+        )
+
+        # JSON mode only produces objects, so the list is wrapped in one
+        return parse_llm_json(response, {}).get("line_items", [])
 
     def validate_invoice(self, invoice_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -128,54 +256,56 @@ Format:
         Returns:
             Validation results with warnings and errors
         """
-        validation_result = {"valid": True, "warnings": [], "errors": []}
+        warnings = []
+        errors = []
+        get = invoice_data.get
 
         # Check required fields
-        required_fields = ["invoice_number", "total", "vendor", "customer"]
-        for field in required_fields:
-            if field not in invoice_data or not invoice_data[field]:
-                validation_result["errors"].append(f"Missing required field: {field}")
-                validation_result["valid"] = False
+        for field in _REQUIRED_INVOICE_FIELDS:
+            if not get(field):
+                errors.append(f"Missing required field: {field}")
 
         # Validate totals
-        if "line_items" in invoice_data and invoice_data["line_items"]:
-            calculated_subtotal = sum(
-                item.get("total", 0) for item in invoice_data["line_items"]
-            )
-            reported_subtotal = invoice_data.get("subtotal", 0)
-
-            if abs(calculated_subtotal - reported_subtotal) > 0.01:
-                validation_result["warnings"].append(
+        line_items = get("line_items")
+        if line_items:
+            # fsum keeps long line-item lists from accumulating rounding error
+            calculated_subtotal = math.fsum(item.get("total", 0) for item in line_items)
+            reported_subtotal = get("subtotal", 0)
+
+            if not _amounts_match(calculated_subtotal, reported_subtotal):
+                warnings.append(
                     f"Subtotal mismatch: calculated {calculated_subtotal}, "
                     f"reported {reported_subtotal}"
                 )
 
+        has_subtotal = "subtotal" in invoice_data
+        has_tax = "tax" in invoice_data
+
         # Validate tax calculation
-        if "subtotal" in invoice_data and "tax_rate" in invoice_data:
+        if has_subtotal and "tax_rate" in invoice_data:
             calculated_tax = invoice_data["subtotal"] * (
                 invoice_data["tax_rate"] / 100
             )
-            reported_tax = invoice_data.get("tax", 0)
+            reported_tax = get("tax", 0)
 
-            if abs(calculated_tax - reported_tax) > 0.01:
-                validation_result["warnings"].append(
+            if not _amounts_match(calculated_tax, reported_tax):
+                warnings.append(
                     f"Tax calculation mismatch: calculated {calculated_tax}, "
                     f"reported {reported_tax}"
                 )
 
         # Validate total
-        if "subtotal" in invoice_data and "tax" in invoice_data:
+        if has_subtotal and has_tax:
             calculated_total = invoice_data["subtotal"] + invoice_data["tax"]
-            reported_total = invoice_data.get("total", 0)
+            reported_total = get("total", 0)
 
-            if abs(calculated_total - reported_total) > 0.01:
-                validation_result["errors"].append(
+            if not _amounts_match(calculated_total, reported_total):
+                errors.append(
                     f"Total mismatch: calculated {calculated_total}, "
                     f"reported {reported_total}"
                 )
-                validation_result["valid"] = False
 
-        return validation_result
+        return {"valid": not errors, "warnings": warnings, "errors": errors}
 
     def extract_and_validate(self, invoice_text: str) -> Dict[str, Any]:
         """
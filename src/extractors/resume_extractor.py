@@ -2,23 +2,144 @@
 Specialized resume/CV parsing module.
 """
 
-import json
-from typing import Dict, Any, List
+import asyncio
+from typing import Dict, Any, Iterator, List, Optional
+from ..providers.clients import run_async
 from ..text_extractor import TextExtractor
+from ..utils.json_utils import parse_llm_json, parse_partial_json, to_json
+from ..utils.text_utils import estimate_tokens
+
+_RESUME_SCHEMA = {
+    "personal_info": {
+        "name": "string",
+        "email": "string",
+        "phone": "string",
+        "location": "string (city, state/country)",
+        "linkedin": "string (URL)",
+        "github": "string (URL)",
+        "website": "string (URL)",
+    },
+    "summary": "string (professional summary/objective)",
+    "work_experience": [
+        {
+            "company": "string",
+            "position": "string",
+            "location": "string",
+            "start_date": "string (MM/YYYY)",
+            "end_date": "string (MM/YYYY or 'Present')",
+            "description": "string",
+            "achievements": ["string"],
+        }
+    ],
+    "education": [
+        {
+            "institution": "string",
+            "degree": "string",
+            "field_of_study": "string",
+            "location": "string",
+            "graduation_date": "string (MM/YYYY)",
+            "gpa": "string (optional)",
+            "honors": ["string"],
+        }
+    ],
+    "skills": {
+        "technical": ["string"],
+        "languages": ["string"],
+        "tools": ["string"],
+        "soft_skills": ["string"],
+    },
+    "certifications": [
+        {
+            "name": "string",
+            "issuing_organization": "string",
+            "date": "string (MM/YYYY)",
+            "credential_id": "string (optional)",
+        }
+    ],
+    "projects": [
+        {
+            "name": "string",
+            "description": "string",
+            "technologies": ["string"],
+            "url": "string (optional)",
+        }
+    ],
+    "awards": ["string"],
+    "publications": ["string"],
+    "languages": [{"language": "string", "proficiency": "string"}],
+}
+
+# Serialized once so every request embeds a byte-identical schema
+_RESUME_SCHEMA_JSON = to_json(_RESUME_SCHEMA, indent=True)
+
+# Static instructions are sent as a cached prompt prefix; only the resume
+# (and job description) text varies between calls.
+_CONTACT_INFO_EXAMPLE = """{
+  "name": "Full Name",
+  "email": "email@example.com",
+  "phone": "+1-234-567-8900",
+  "location": "City, State",
+  "linkedin": "https://linkedin.com/in/username",
+  "github": "https://github.com/username",
+  "website": "https://example.com"
+}"""
+
+_CONTACT_INFO_INSTRUCTIONS = f"""Extract contact information from the resume in the user message.
+
+Return ONLY a JSON object with these fields (use null for missing fields):
+{_CONTACT_INFO_EXAMPLE}"""
+
+# Contact info has a fixed set of short fields, so the response cap is sized
+# from the example. Real names and profile URLs run several times longer than
+# the placeholders, tokenizers split URLs finely and Anthropic's forced tool
+# call adds output overhead, while a truncated response parses as {}, so the
+# headroom is generous and the cap never drops below a floor.
+_CONTACT_INFO_MAX_TOKENS = max(300, 5 * estimate_tokens(_CONTACT_INFO_EXAMPLE))
+
+_SKILLS_INSTRUCTIONS = """Extract all skills from the resume in the user message, categorized by type.
+
+Return ONLY a JSON object:
+{
+  "technical": ["Python", "Java", "etc"],
+  "languages": ["English", "Spanish", "etc"],
+  "tools": ["Git", "Docker", "etc"],
+  "soft_skills": ["Leadership", "Communication", "etc"]
+}"""
+
+_MATCH_INSTRUCTIONS = """Analyze how well the resume in the user message matches the job description.
+
+Return a JSON object with:
+{
+  "match_score": 0-100,
+  "matching_skills": ["skill1", "skill2"],
+  "missing_skills": ["skill3", "skill4"],
+  "relevant_experience": ["experience1", "experience2"],
+  "strengths": ["strength1", "strength2"],
+  "gaps": ["gap1", "gap2"],
+  "recommendations": ["recommendation1", "recommendation2"],
+  "summary": "Brief analysis of the match"
+}"""
 
 
 class ResumeExtractor:
     """Extract structured data from resumes and CVs."""
 
-    def __init__(self, provider: str = None, api_key: str = None):
+    def __init__(
+        self,
+        provider: str = None,
+        api_key: str = None,
+        extractor: Optional[TextExtractor] = None,
+    ):
         """
         Initialize ResumeExtractor.
 
         Args:
             provider: LLM provider name
             api_key: API key for the provider
+            extractor: Preconstructed TextExtractor to reuse; provider and
+                api_key are ignored when given
         """
-        self.extractor = TextExtractor(provider=provider, api_key=api_key)
+        self.extractor = extractor or TextExtractor(provider=provider, api_key=api_key)
 
     def extract(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -30,67 +151,23 @@ class ResumeExtractor:
         Returns:
             Dictionary with extracted resume data
         """
-        schema = {
-            "personal_info": {
-                "name": "string",
-                "email": "string",
-                "phone": "string",
-                "location": "string (city, state/country)",
-                "linkedin": "string (URL)",
-                "github": "string (URL)",
-                "website": "string (URL)",
-            },
-            "summary": "string (professional summary/objective)",
-            "work_experience": [
-                {
-                    "company": "string",
-                    "position": "string",
-                    "location": "string",
-                    "start_date": "string (MM/YYYY)",
-                    "end_date": "string (MM/YYYY or 'Present')",
-                    "description": "string",
-                    "achievements": ["string"],
-                }
-            ],
-            "education": [
-                {
-                    "institution": "string",
-                    "degree": "string",
-                    "field_of_study": "string",
-                    "location": "string",
-                    "graduation_date": "string (MM/YYYY)",
-                    "gpa": "string (optional)",
-                    "honors": ["string"],
-                }
-            ],
-            "skills": {
-                "technical": ["string"],
-                "languages": ["string"],
-                "tools": ["string"],
-                "soft_skills": ["string"],
-            },
-            "certifications": [
-                {
-                    "name": "string",
-                    "issuing_organization": "string",
-                    "date": "string (MM/YYYY)",
-                    "credential_id": "string (optional)",
-                }
-            ],
-            "projects": [
-                {
-                    "name": "string",
-                    "description": "string",
-                    "technologies": ["string"],
-                    "url": "string (optional)",
-                }
-            ],
-            "awards": ["string"],
-            "publications": ["string"],
-            "languages": [{"language": "string", "proficiency": "string"}],
-        }
+        return self.extractor.extract_structured_data(
+            resume_text, _RESUME_SCHEMA_JSON
+        )
+
+    async def aextract(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Extract structured information from resume text using the async client.
 
-        return self.extractor.extract_structured_data(resume_text, schema)
+        Args:
+            resume_text: Raw resume text
+
+        Returns:
+            Dictionary with extracted resume data
+        """
+        return await self.extractor.aextract_structured_data(
+            resume_text, _RESUME_SCHEMA_JSON
+        )
 
     def extract_contact_info(self, resume_text: str) -> Dict[str, str]:
         """
@@ -102,42 +179,31 @@ class ResumeExtractor:
         Returns:
             Dictionary with contact information
         """
-        prompt = f"""Extract contact information from this resume.
+        response = self.extractor.provider.complete_json(
+            f"Resume:\n{resume_text}",
+            temperature=0.0,
+            max_tokens=_CONTACT_INFO_MAX_TOKENS,
+            cached_prefix=_CONTACT_INFO_INSTRUCTIONS,
+        )
+        return parse_llm_json(response, {})
 
-Resume:
-{resume_text}
+    async def aextract_contact_info(self, resume_text: str) -> Dict[str, str]:
+        """
+        Extract only contact information from resume using the async client.
 
-Return ONLY a JSON object with these fields (use null for missing fields):
-{{
-  "name": "Full Name",
-  "email": "email@example.com",
-  "phone": "+1-234-567-8900",
-  "location": "City, State",
-  "linkedin": "https://linkedin.com/in/username",
-  "github": "https://github.com/username",
-  "website": "https://example.com"
-}}"""
+        Args:
+            resume_text: Raw resume text
 
-        response = self.extractor.provider.complete(
-            prompt, temperature=0.1, max_tokens=500
+        Returns:
+            Dictionary with contact information
+        """
+        response = await self.extractor.provider.acomplete_json(
+            f"Resume:\n{resume_text}",
+            temperature=0.0,
+            max_tokens=_CONTACT_INFO_MAX_TOKENS,
+            cached_prefix=_CONTACT_INFO_INSTRUCTIONS,
         )
-
-        try:
-            contact_info = json.loads(response)
-            return contact_info
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {}
+        return parse_llm_json(response, {})
 
     def extract_skills(self, resume_text: str) -> Dict[str, List[str]]:
         """
@@ -149,44 +215,41 @@ Return ONLY a JSON object with these fields (use null for missing fields):
         Returns:
             Dictionary categorizing different types of skills
         """
-        prompt = f"""Extract all skills from this resume, categorized by type.
+        response = self.extractor.provider.complete_json(
+            f"Resume:\n{resume_text}",
+            temperature=0.0,
+            max_tokens=1000,
+            cached_prefix=_SKILLS_INSTRUCTIONS,
+        )
+        return parse_llm_json(response, self._empty_skills())
 
-Resume:
-{resume_text}
+    async def aextract_skills(self, resume_text: str) -> Dict[str, List[str]]:
+        """
+        Extract only skills from resume using the async client.
 
-Return ONLY a JSON object:
-{{
-  "technical": ["Python", "Java", "etc"],
-  "languages": ["English", "Spanish", "etc"],
-  "tools": ["Git", "Docker", "etc"],
-  "soft_skills": ["Leadership", "Communication", "etc"]
-}}"""
+        Args:
+            resume_text: Raw resume text
 
-        response = self.extractor.provider.complete(
-            prompt, temperature=0.1, max_tokens=1000
+        Returns:
+            Dictionary categorizing different types of skills
+        """
+        response = await self.extractor.provider.acomplete_json(
+            f"Resume:\n{resume_text}",
+            temperature=0.0,
+            max_tokens=1000,
+            cached_prefix=_SKILLS_INSTRUCTIONS,
         )
-
-        try:
-            skills = json.loads(response)
-            return skills
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {
-                    "technical": [],
-                    "languages": [],
-                    "tools": [],
-                    "soft_skills": [],
-                }
+        return parse_llm_json(response, self._empty_skills())
+
+    @staticmethod
+    def _empty_skills() -> Dict[str, List[str]]:
+        """Return the skills result used when the response cannot be parsed."""
+        return {
+            "technical": [],
+            "languages": [],
+            "tools": [],
+            "soft_skills": [],
+        }
 
     def match_job_description(
         self, resume_text: str, job_description: str
@@ -201,46 +264,143 @@ Return ONLY a JSON object:
         Returns:
             Dictionary with match analysis
         """
-        prompt = f"""Analyze how well this resume matches the job description.
+        response = self.extractor.provider.complete_json(
+            f"Resume:\n{resume_text}\n\nJob Description:\n{job_description}",
+            temperature=0.0,
+            max_tokens=1500,
+            cached_prefix=_MATCH_INSTRUCTIONS,
+        )
+        return parse_llm_json(response, {"error": "Failed to parse match analysis"})
 
-Resume:
-{resume_text}
+    async def amatch_job_description(
+        self, resume_text: str, job_description: str
+    ) -> Dict[str, Any]:
+        """
+        Analyze how well a resume matches a job description using the async client.
 
-Job Description:
-{job_description}
+        Args:
+            resume_text: Raw resume text
+            job_description: Job description text
 
-Return a JSON object with:
-{{
-  "match_score": 0-100,
-  "matching_skills": ["skill1", "skill2"],
-  "missing_skills": ["skill3", "skill4"],
-  "relevant_experience": ["experience1", "experience2"],
-  "strengths": ["strength1", "strength2"],
-  "gaps": ["gap1", "gap2"],
-  "recommendations": ["recommendation1", "recommendation2"],
-  "summary": "Brief analysis of the match"
-}}"""
+        Returns:
+            Dictionary with match analysis
+        """
+        response = await self.extractor.provider.acomplete_json(
+            f"Resume:\n{resume_text}\n\nJob Description:\n{job_description}",
+            temperature=0.0,
+            max_tokens=1500,
+            cached_prefix=_MATCH_INSTRUCTIONS,
+        )
+        return parse_llm_json(response, {"error": "Failed to parse match analysis"})
+
+    def stream_match_job_description(
+        self, resume_text: str, job_description: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze a job match, yielding partial results while the response streams.
+
+        Each yielded dictionary holds the fields received so far, with lists
+        such as matching_skills growing as items arrive. The last item is the
+        complete analysis, as returned by match_job_description; it is not
+        repeated when the final partial result already equals it.
+
+        Args:
+            resume_text: Raw resume text
+            job_description: Job description text
 
-        response = self.extractor.provider.complete(
-            prompt, temperature=0.1, max_tokens=1500
+        Yields:
+            Partial match analyses, followed by the complete one
+        """
+        text = ""
+        parsed_length = 0
+        completed = False
+        last = None
+
+        for chunk in self.extractor.provider.stream(
+            f"Resume:\n{resume_text}\n\nJob Description:\n{job_description}",
+            temperature=0.0,
+            max_tokens=1500,
+            cached_prefix=_MATCH_INSTRUCTIONS,
+        ):
+            text += chunk
+            # A value can only have been completed by one of these characters
+            completed = completed or any(char in chunk for char in ",]}")
+            # Every parse rereads the whole response, so wait until the text
+            # has grown by a quarter since the last one; the total parsing
+            # work then stays linear in the response length
+            if not completed or len(text) - parsed_length < parsed_length // 4:
+                continue
+            completed = False
+            parsed_length = len(text)
+            partial = parse_partial_json(text)
+            if isinstance(partial, dict) and partial != last:
+                last = partial
+                yield partial
+
+        result = parse_llm_json(text, {"error": "Failed to parse match analysis"})
+        if result != last:
+            yield result
+
+    async def aextract_full(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Extract contact information and skills concurrently.
+
+        Both requests are issued through the async client and awaited
+        together, so the total latency is that of the slower call.
+
+        Args:
+            resume_text: Raw resume text
+
+        Returns:
+            Dictionary with "contact_info" and "skills" keys
+        """
+        contact_info, skills = await asyncio.gather(
+            self.aextract_contact_info(resume_text),
+            self.aextract_skills(resume_text),
         )
+        return {"contact_info": contact_info, "skills": skills}
 
-        try:
-            match_analysis = json.loads(response)
-            return match_analysis
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {"error": "Failed to parse match analysis"}
+    async def afull_analysis(
+        self, resume_text: str, job_description: str
+    ) -> Dict[str, Any]:
+        """
+        Run the complete resume pipeline with independent requests in parallel.
+
+        Structured extraction, job matching and skills extraction only depend
+        on the input texts and are awaited together; the summary needs the
+        extracted data and follows once it is available.
+
+        Args:
+            resume_text: Raw resume text
+            job_description: Job description text
+
+        Returns:
+            Dictionary with "data", "match", "skills" and "summary" keys
+        """
+        data, match, skills = await asyncio.gather(
+            self.aextract(resume_text),
+            self.amatch_job_description(resume_text, job_description),
+            self.aextract_skills(resume_text),
+        )
+        summary = await self.agenerate_summary(data)
+        return {"data": data, "match": match, "skills": skills, "summary": summary}
+
+    def full_analysis(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+        """
+        Run afull_analysis from synchronous code.
+
+        The analysis runs in its own event loop, whose async clients are
+        closed when it finishes. Must not be called while an event loop is
+        running; await afull_analysis directly in that case.
+
+        Args:
+            resume_text: Raw resume text
+            job_description: Job description text
+
+        Returns:
+            Dictionary with "data", "match", "skills" and "summary" keys
+        """
+        return run_async(self.afull_analysis(resume_text, job_description))
 
     def generate_summary(self, resume_data: Dict[str, Any]) -> str:
         """
@@ -252,12 +412,29 @@ Return a JSON object with:
         Returns:
             Professional summary text
         """
-        prompt = f"""Based on this resume data, write a compelling 2-3 sentence professional summary:
+        return self.extractor.provider.complete(
+            self._summary_prompt(resume_data), temperature=0.3, max_tokens=300
+        )
 
-{json.dumps(resume_data, indent=2)}
+    async def agenerate_summary(self, resume_data: Dict[str, Any]) -> str:
+        """
+        Generate a professional summary using the async client.
 
-Write a concise, impactful professional summary that highlights key qualifications and value proposition."""
+        Args:
+            resume_data: Extracted resume data
 
-        return self.extractor.provider.complete(
-            prompt, temperature=0.3, max_tokens=300
+        Returns:
+            Professional summary text
+        """
+        return await self.extractor.provider.acomplete(
+            self._summary_prompt(resume_data), temperature=0.3, max_tokens=300
         )
+
+    @staticmethod
+    def _summary_prompt(resume_data: Dict[str, Any]) -> str:
+        """Build the professional summary prompt."""
+        return f"""Based on this resume data, write a compelling 2-3 sentence professional summary:
+
+{to_json(resume_data, indent=True)}
+
+Write a concise, impactful professional summary that highlights key qualifications and value proposition."""
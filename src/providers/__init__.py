@@ -4,5 +4,28 @@ LLM Provider implementations.
 
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
+from .cache import ResponseCache
+from .clients import (
+    close_async_clients,
+    get_anthropic_client,
+    get_async_anthropic_client,
+    get_async_http_client,
+    get_async_openai_client,
+    get_http_client,
+    get_openai_client,
+    run_async,
+)
 
-__all__ = ["OpenAIProvider", "AnthropicProvider"]
+__all__ = [
+    "OpenAIProvider",
+    "AnthropicProvider",
+    "ResponseCache",
+    "get_openai_client",
+    "get_async_openai_client",
+    "get_anthropic_client",
+    "get_async_anthropic_client",
+    "get_http_client",
+    "get_async_http_client",
+    "close_async_clients",
+    "run_async",
+]
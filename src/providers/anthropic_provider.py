@@ -2,8 +2,16 @@
 Anthropic (Claude) provider implementation for text extraction.
 """
 
-from typing import Optional
-from anthropic import Anthropic
+import logging
+from typing import Iterator, Optional
+
+from .clients import get_anthropic_client, get_async_anthropic_client
+from ..utils.json_utils import to_json
+
+logger = logging.getLogger(__name__)
+
+# Tool the model is forced to call in complete_json; its input is the result
+_JSON_TOOL_NAME = "record_result"
 
 
 class AnthropicProvider:
@@ -20,15 +28,22 @@ class AnthropicProvider:
         if not api_key:
             raise ValueError("Anthropic API key is required")
 
-        self.client = Anthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
+        self._api_key = api_key
         self.model = model
 
+    @property
+    def aclient(self):
+        """Async Anthropic client of the running event loop."""
+        return get_async_anthropic_client(self._api_key)
+
     def complete(
         self,
         prompt: str,
         temperature: float = 0.1,
         max_tokens: int = 2000,
         system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
     ) -> str:
         """
         Generate completion using Anthropic API.
@@ -38,24 +53,270 @@ class AnthropicProvider:
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
             system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent as
+                an ephemeral prompt-cache block
 
         Returns:
             Completion text
         """
         try:
-            kwargs = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "messages": [{"role": "user", "content": prompt}],
-            }
+            response = self.client.messages.create(
+                **self._build_kwargs(
+                    prompt, temperature, max_tokens, system_message, cached_prefix
+                )
+            )
+            self._log_cache_usage(response)
 
-            if system_message:
-                kwargs["system"] = system_message
+            return response.content[0].text
 
-            response = self.client.messages.create(**kwargs)
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+
+    async def acomplete(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate completion using the async Anthropic client.
+
+        Awaiting several calls together with asyncio.gather overlaps their
+        network round trips.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent as
+                an ephemeral prompt-cache block
+
+        Returns:
+            Completion text
+        """
+        try:
+            response = await self.aclient.messages.create(
+                **self._build_kwargs(
+                    prompt, temperature, max_tokens, system_message, cached_prefix
+                )
+            )
+            self._log_cache_usage(response)
 
             return response.content[0].text
 
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate a completion and yield its text as it is produced.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent as
+                an ephemeral prompt-cache block
+
+        Yields:
+            Text deltas, in order
+        """
+        try:
+            with self.client.messages.stream(
+                **self._build_kwargs(
+                    prompt, temperature, max_tokens, system_message, cached_prefix
+                )
+            ) as stream:
+                yield from stream.text_stream
+                self._log_cache_usage(stream.get_final_message())
+
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+
+    def _build_kwargs(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        system_message: Optional[str],
+        cached_prefix: Optional[str] = None,
+    ) -> dict:
+        """
+        Build the Messages API arguments for a request.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system message
+            cached_prefix: Optional static prefix marked for prompt caching
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        kwargs = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+        if cached_prefix:
+            system = [
+                {
+                    "type": "text",
+                    "text": cached_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+            if system_message:
+                system.append({"type": "text", "text": system_message})
+            kwargs["system"] = system
+        elif system_message:
+            kwargs["system"] = system_message
+
+        return kwargs
+
+    @staticmethod
+    def _log_cache_usage(response) -> None:
+        """
+        Log prompt cache reads and writes reported for a response.
+
+        Args:
+            response: Messages API response
+        """
+        usage = getattr(response, "usage", None)
+        cache_read = getattr(usage, "cache_read_input_tokens", None)
+        cache_write = getattr(usage, "cache_creation_input_tokens", None)
+        if cache_read or cache_write:
+            logger.debug(
+                "Anthropic prompt cache: %s tokens read, %s tokens written",
+                cache_read or 0,
+                cache_write or 0,
+            )
+
+    def complete_json(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a completion that is guaranteed to be a single JSON object.
+
+        The model is forced to call a single tool whose input is the result,
+        so the reply is structured data rather than free-form text.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Static instructions shared across calls, sent as
+                an ephemeral prompt-cache block
+
+        Returns:
+            JSON response
+        """
+        try:
+            response = self.client.messages.create(
+                **self._build_json_kwargs(
+                    prompt, temperature, max_tokens, cached_prefix
+                )
+            )
+            self._log_cache_usage(response)
+
+            return self._tool_result(response)
+
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+
+    async def acomplete_json(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a single JSON object using the async Anthropic client.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Static instructions shared across calls, sent as
+                an ephemeral prompt-cache block
+
+        Returns:
+            JSON response
+        """
+        try:
+            response = await self.aclient.messages.create(
+                **self._build_json_kwargs(
+                    prompt, temperature, max_tokens, cached_prefix
+                )
+            )
+            self._log_cache_usage(response)
+
+            return self._tool_result(response)
+
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+
+    def _build_json_kwargs(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        cached_prefix: Optional[str],
+    ) -> dict:
+        """
+        Build Messages API arguments that force a single structured tool call.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Optional static prefix marked for prompt caching
+
+        Returns:
+            Keyword arguments for messages.create
+        """
+        kwargs = self._build_kwargs(prompt, temperature, max_tokens, None, cached_prefix)
+        kwargs["tools"] = [
+            {
+                "name": _JSON_TOOL_NAME,
+                "description": "Record the requested result as a JSON object.",
+                "input_schema": {"type": "object"},
+            }
+        ]
+        kwargs["tool_choice"] = {"type": "tool", "name": _JSON_TOOL_NAME}
+        return kwargs
+
+    @staticmethod
+    def _tool_result(response) -> str:
+        """
+        Serialize the input of the forced tool call in a response.
+
+        Args:
+            response: Messages API response
+
+        Returns:
+            JSON response
+        """
+        for block in response.content:
+            if block.type == "tool_use":
+                return to_json(block.input)
+        raise ValueError("Response did not contain a tool call")
@@ -0,0 +1,203 @@
+"""
+In-memory caching of LLM responses.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ResponseCache:
+    """Thread-safe least-recently-used cache for LLM responses."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep
+            ttl: Default lifetime of an entry in seconds (None keeps entries
+                until they are evicted)
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from the parts that determine a response.
+
+        Args:
+            parts: Values such as model name, prompt and sampling parameters
+
+        Returns:
+            128-bit BLAKE2b hex digest of the parts
+        """
+        return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            expires_at, value = self._entries[key]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a response, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key from make_key
+            value: Response to cache
+            ttl: Lifetime of this entry in seconds (defaults to self.ttl)
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CachedProvider:
+    """
+    Provider wrapper that serves repeated low-temperature requests from a cache.
+
+    Wraps the completion methods of any provider; all other attributes are
+    forwarded to the wrapped provider. Prompts must match exactly unless
+    normalize_whitespace is set. Requests sampled above max_temperature are
+    never cached, since their responses are meant to vary.
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        cache: ResponseCache,
+        max_temperature: float = 0.2,
+        normalize_whitespace: bool = False,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: Provider instance to wrap
+            cache: Cache to store responses in
+            max_temperature: Highest temperature whose responses are cached
+            normalize_whitespace: Whether prompts that differ only in runs of
+                whitespace share an entry. Leave off when layout matters,
+                such as for tables, resumes or code.
+        """
+        self.provider = provider
+        self.cache = cache
+        self.max_temperature = max_temperature
+        self.normalize_whitespace = normalize_whitespace
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.provider, name)
+
+    def _key(
+        self, method: str, prompt: str, params: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Build the cache key for a request, or None if it must not be cached.
+
+        Args:
+            method: Provider method name
+            prompt: User prompt
+            params: Remaining request arguments
+
+        Returns:
+            Cache key or None
+        """
+        if params.get("temperature", 0.1) > self.max_temperature:
+            return None
+        if self.normalize_whitespace:
+            prompt = " ".join(prompt.split())
+        return ResponseCache.make_key(
+            self.provider.model, method, prompt, sorted(params.items())
+        )
+
+    def complete(self, prompt: str, **params: Any) -> str:
+        """Cached provider.complete."""
+        return self._call("complete", prompt, params)
+
+    def complete_json(self, prompt: str, **params: Any) -> str:
+        """Cached provider.complete_json."""
+        return self._call("complete_json", prompt, params)
+
+    async def acomplete(self, prompt: str, **params: Any) -> str:
+        """Cached provider.acomplete."""
+        return await self._acall("acomplete", prompt, params)
+
+    async def acomplete_json(self, prompt: str, **params: Any) -> str:
+        """Cached provider.acomplete_json."""
+        return await self._acall("acomplete_json", prompt, params)
+
+    def _call(self, method: str, prompt: str, params: Dict[str, Any]) -> str:
+        """
+        Serve a synchronous request from the cache or the wrapped provider.
+
+        Args:
+            method: Provider method name
+            prompt: User prompt
+            params: Remaining request arguments
+
+        Returns:
+            Completion text
+        """
+        key = self._key(method, prompt, params)
+        response = self.cache.get(key) if key else None
+        if response is None:
+            response = getattr(self.provider, method)(prompt, **params)
+            if key:
+                self.cache.set(key, response)
+        return response
+
+    async def _acall(self, method: str, prompt: str, params: Dict[str, Any]) -> str:
+        """
+        Serve an asynchronous request from the cache or the wrapped provider.
+
+        Args:
+            method: Provider method name
+            prompt: User prompt
+            params: Remaining request arguments
+
+        Returns:
+            Completion text
+        """
+        key = self._key(method, prompt, params)
+        response = self.cache.get(key) if key else None
+        if response is None:
+            response = await getattr(self.provider, method)(prompt, **params)
+            if key:
+                self.cache.set(key, response)
+        return response
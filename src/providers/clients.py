@@ -0,0 +1,212 @@
+"""
+Shared SDK clients for the LLM providers.
+
+Each SDK client owns an HTTP connection pool, so clients are created once per
+API key and reused by every provider instance instead of being rebuilt for
+each extractor. All SDK clients also share one tuned HTTP connection pool
+(one for sync clients, one for async clients), so concurrent batch requests
+reuse warm connections instead of each SDK client keeping its own small pool.
+
+Async connections belong to the event loop that opened them, so async clients
+are cached per running loop rather than for the whole process.
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, TypeVar
+
+import httpx
+from anthropic import Anthropic, AsyncAnthropic
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Connection pool sized for concurrent batch extraction
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Long enough for large completions, but fail fast on unreachable hosts
+_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Retries with exponential backoff, handled by the SDKs on connection
+# errors, rate limits and 5xx responses
+_MAX_RETRIES = 3
+
+T = TypeVar("T")
+
+# Async clients of each event loop, keyed weakly so they are dropped
+# together with the loop
+_ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """
+    Get the HTTP client shared by all synchronous SDK clients.
+
+    HTTP/2 is enabled when the optional h2 package is installed.
+
+    Returns:
+        httpx.Client, closed automatically at interpreter exit
+    """
+    client = httpx.Client(limits=_LIMITS, timeout=_TIMEOUT, http2=_HTTP2)
+    atexit.register(client.close)
+    return client
+
+
+def _loop_clients() -> Dict[Any, Any]:
+    """
+    Get the async client cache of the running event loop.
+
+    Returns:
+        Dictionary of clients created on the running loop
+
+    Raises:
+        RuntimeError: If no event loop is running
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        return _ASYNC_CLIENTS.setdefault(loop, {})
+
+
+def _new_async_http_client() -> httpx.AsyncClient:
+    """Create an async HTTP client with the shared pool settings."""
+    return httpx.AsyncClient(limits=_LIMITS, timeout=_TIMEOUT, http2=_HTTP2)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the HTTP client shared by the asynchronous SDK clients of this loop.
+
+    HTTP/2 is enabled when the optional h2 package is installed. Must be
+    called while an event loop is running.
+
+    Returns:
+        httpx.AsyncClient, closed by close_async_clients
+    """
+    clients = _loop_clients()
+    if "http" not in clients:
+        clients["http"] = _new_async_http_client()
+    return clients["http"]
+
+
+async def close_async_clients() -> None:
+    """Close and forget the async clients created on the running loop."""
+    with _ASYNC_CLIENTS_LOCK:
+        clients = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), {})
+    if "http" in clients:
+        await clients["http"].aclose()
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """
+    Run an awaitable in a new event loop from synchronous code.
+
+    The loop's async clients are closed before the loop ends, so no pooled
+    connection outlives the loop that opened it. Must not be called while an
+    event loop is running.
+
+    Args:
+        awaitable: Coroutine to run
+
+    Returns:
+        Result of the awaitable
+    """
+
+    async def main() -> T:
+        try:
+            return await awaitable
+        finally:
+            await close_async_clients()
+
+    return asyncio.run(main())
+
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Get the shared OpenAI client for an API key.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        OpenAI client
+    """
+    return OpenAI(
+        api_key=api_key,
+        http_client=get_http_client(),
+        timeout=_TIMEOUT,
+        max_retries=_MAX_RETRIES,
+    )
+
+
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get the async OpenAI client of the running event loop for an API key.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        AsyncOpenAI client
+    """
+    clients = _loop_clients()
+    key = ("openai", api_key)
+    if key not in clients:
+        clients[key] = AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_async_http_client(),
+            timeout=_TIMEOUT,
+            max_retries=_MAX_RETRIES,
+        )
+    return clients[key]
+
+
+@lru_cache(maxsize=8)
+def get_anthropic_client(api_key: str) -> Anthropic:
+    """
+    Get the shared Anthropic client for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Anthropic client
+    """
+    return Anthropic(
+        api_key=api_key,
+        http_client=get_http_client(),
+        timeout=_TIMEOUT,
+        max_retries=_MAX_RETRIES,
+    )
+
+
+def get_async_anthropic_client(api_key: str) -> AsyncAnthropic:
+    """
+    Get the async Anthropic client of the running event loop for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        AsyncAnthropic client
+    """
+    clients = _loop_clients()
+    key = ("anthropic", api_key)
+    if key not in clients:
+        clients[key] = AsyncAnthropic(
+            api_key=api_key,
+            http_client=get_async_http_client(),
+            timeout=_TIMEOUT,
+            max_retries=_MAX_RETRIES,
+        )
+    return clients[key]
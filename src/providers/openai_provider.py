@@ -2,13 +2,10 @@
 OpenAI provider implementation for text extraction.
 """
 
-import os
-from typing import Optional
-from openai import OpenAI
-from dotenv import load_dotenv
+from typing import Iterator, Optional
+
+from .clients import get_async_openai_client, get_openai_client
 
-# Load environment variables
-load_dotenv()
 
 class OpenAIProvider:
     """Provider class for OpenAI API integration."""
@@ -24,15 +21,22 @@ class OpenAIProvider:
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))        
+        self.client = get_openai_client(api_key)
+        self._api_key = api_key
         self.model = model
 
+    @property
+    def aclient(self):
+        """Async OpenAI client of the running event loop."""
+        return get_async_openai_client(self._api_key)
+
     def complete(
         self,
         prompt: str,
         temperature: float = 0.1,
         max_tokens: int = 2000,
         system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
     ) -> str:
         """
         Generate completion using OpenAI API.
@@ -42,35 +46,135 @@ class OpenAIProvider:
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
             system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent
+                first so OpenAI's automatic prefix caching can reuse them
 
         Returns:
             Completion text
         """
-        messages = []
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt, system_message, cached_prefix),
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
 
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
+            return response.choices[0].message.content
 
-        messages.append({"role": "user", "content": prompt})
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+    async def acomplete(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate completion using the async OpenAI client.
+
+        Awaiting several calls together with asyncio.gather overlaps their
+        network round trips.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent
+                first so OpenAI's automatic prefix caching can reuse them
+
+        Returns:
+            Completion text
+        """
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt, system_message, cached_prefix),
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+
+            return response.choices[0].message.content
 
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+    def stream(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        system_message: Optional[str] = None,
+        cached_prefix: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate a completion and yield its text as it is produced.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system message
+            cached_prefix: Static instructions shared across calls, sent
+                first so OpenAI's automatic prefix caching can reuse them
+
+        Yields:
+            Text deltas, in order
+        """
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self._build_messages(prompt, system_message, cached_prefix),
                 temperature=temperature,
                 max_tokens=max_tokens,
+                stream=True,
             )
 
-            return response.choices[0].message.content
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
 
+    @staticmethod
+    def _build_messages(
+        prompt: str,
+        system_message: Optional[str],
+        cached_prefix: Optional[str] = None,
+    ) -> list:
+        """
+        Build the chat messages for a request.
+
+        Args:
+            prompt: User prompt
+            system_message: Optional system message
+            cached_prefix: Optional static prefix, placed before everything else
+
+        Returns:
+            List of chat messages
+        """
+        messages = []
+
+        if cached_prefix:
+            messages.append({"role": "system", "content": cached_prefix})
+
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     def complete_with_json(
         self,
         prompt: str,
         temperature: float = 0.1,
         max_tokens: int = 2000,
+        cached_prefix: Optional[str] = None,
     ) -> str:
         """
         Generate completion with JSON mode enabled.
@@ -79,20 +183,101 @@ class OpenAIProvider:
             prompt: User prompt
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            cached_prefix: Static instructions shared across calls, sent first
 
         Returns:
             JSON response
         """
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                response_format={"type": "json_object"},
+                **self._build_json_kwargs(
+                    prompt, temperature, max_tokens, cached_prefix
+                )
             )
 
             return response.choices[0].message.content
 
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
+
+    def complete_json(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a completion that is a single JSON object.
+
+        This is the JSON entry point shared with AnthropicProvider; on OpenAI
+        it is JSON mode, as in complete_with_json.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Static instructions shared across calls, sent first
+
+        Returns:
+            JSON response
+        """
+        return self.complete_with_json(prompt, temperature, max_tokens, cached_prefix)
+
+    async def acomplete_json(
+        self,
+        prompt: str,
+        temperature: float = 0.1,
+        max_tokens: int = 2000,
+        cached_prefix: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a single JSON object using the async OpenAI client.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Static instructions shared across calls, sent first
+
+        Returns:
+            JSON response
+        """
+        try:
+            response = await self.aclient.chat.completions.create(
+                **self._build_json_kwargs(
+                    prompt, temperature, max_tokens, cached_prefix
+                )
+            )
+
+            return response.choices[0].message.content
+
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+    def _build_json_kwargs(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        cached_prefix: Optional[str],
+    ) -> dict:
+        """
+        Build Chat Completions arguments for a JSON mode request.
+
+        Args:
+            prompt: User prompt
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            cached_prefix: Optional static prefix, placed before everything else
+
+        Returns:
+            Keyword arguments for chat.completions.create
+        """
+        return {
+            "model": self.model,
+            "messages": self._build_messages(prompt, None, cached_prefix),
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"},
+        }
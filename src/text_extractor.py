@@ -3,17 +3,111 @@ Main text extraction and understanding module.
 Provides a unified interface for various text extraction tasks using LLMs.
 """
 
+import asyncio
 import os
-from typing import Dict, List, Optional, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 from dotenv import load_dotenv
 import json
 
 from .providers.openai_provider import OpenAIProvider
 from .providers.anthropic_provider import AnthropicProvider
+from .providers.cache import CachedProvider, ResponseCache
+from .providers.clients import run_async
+from .utils.json_utils import parse_llm_json, parse_partial_json, to_json
+from .utils.text_utils import split_into_chunks
 
 # Load environment variables
 load_dotenv()
 
+# Methods that batch() can run; each has an async counterpart prefixed "a"
+_BATCH_METHODS = frozenset(
+    {
+        "extract_entities",
+        "summarize",
+        "analyze_sentiment",
+        "extract_structured_data",
+        "classify_text",
+        "extract_key_information",
+    }
+)
+
+# Instruction templates are built once; each call only fills in its
+# parameters. Literal JSON braces are doubled for str.format.
+_DEFAULT_ENTITY_TYPES = (
+    "people",
+    "organizations",
+    "locations",
+    "dates",
+    "money",
+    "products",
+)
+
+_ENTITIES_INSTRUCTIONS = """Extract named entities from the text above and return them as a JSON object.
+
+Entity types to extract: {types}
+
+Return ONLY a valid JSON object with entity types as keys and arrays of entities as values. Example format:
+{{
+  "people": ["John Doe", "Jane Smith"],
+  "organizations": ["Company A"],
+  "locations": ["New York"],
+  "dates": ["January 2024"],
+  "money": ["$1,000"],
+  "products": ["Product X"]
+}}"""
+
+_DEFAULT_ENTITIES_INSTRUCTIONS = _ENTITIES_INSTRUCTIONS.format(
+    types=", ".join(_DEFAULT_ENTITY_TYPES)
+)
+
+_SUMMARY_LENGTHS = {
+    "short": "2-3 sentences",
+    "medium": "1 paragraph (4-6 sentences)",
+    "long": "2-3 paragraphs",
+}
+
+_SUMMARY_STYLES = {
+    "paragraph": "Write in clear, concise paragraphs.",
+    "bullets": "Use bullet points for key information.",
+    "executive": "Write as an executive summary with key takeaways.",
+}
+
+# Output tokens budgeted per summary in multi_summarize, by length, with
+# room for JSON escaping; the combined response is capped at what current
+# models can return in one request
+_SUMMARY_MAX_TOKENS = {"short": 200, "medium": 400, "long": 1000}
+_MULTI_SUMMARY_MAX_TOKENS = 4096
+
+_SENTIMENT_INSTRUCTIONS = """Analyze the sentiment and emotional tone of the text above.
+
+Return a JSON object with:
+- overall_sentiment: "positive", "negative", or "neutral"
+- confidence: 0.0 to 1.0
+- emotions: list of detected emotions
+- key_phrases: list of phrases that influenced the sentiment
+- reasoning: brief explanation
+
+Return ONLY valid JSON:"""
+
+_CLASSIFY_INSTRUCTIONS = """Classify the text above into one or more of these categories:
+{categories}
+
+{label_instruction}
+
+Return your answer as a JSON object:
+{{"categories": ["category1", "category2"]}} for multi-label
+OR
+{{"category": "category1"}} for single-label
+
+Return ONLY valid JSON:"""
+
+_KEY_INFORMATION_INSTRUCTIONS = """Extract the following information from the text above:
+{types}
+
+Return the extracted information as a JSON object with the information types as keys.
+Return ONLY valid JSON:"""
+
 
 class TextExtractor:
     """
@@ -28,6 +122,8 @@ class TextExtractor:
         model: str = None,
         temperature: float = 0.1,
         max_tokens: int = 2000,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
     ):
         """
         Initialize the TextExtractor.
@@ -38,10 +134,15 @@ class TextExtractor:
             model: Model name to use
             temperature: Sampling temperature (0.0 to 1.0)
             max_tokens: Maximum tokens in response
+            cache_size: Number of LLM responses to memoize (0 disables caching)
+            cache_ttl: Seconds a memoized response stays valid (None for no expiry)
         """
         self.provider_name = provider or os.getenv("DEFAULT_PROVIDER", "openai")
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = (
+            ResponseCache(cache_size, ttl=cache_ttl) if cache_size > 0 else None
+        )
 
         # Initialize the appropriate provider
         if self.provider_name == "openai":
@@ -61,6 +162,71 @@ class TextExtractor:
                 "Use 'openai' or 'anthropic'."
             )
 
+        # Wrapping the provider also caches the extractors' direct calls
+        if self.cache is not None:
+            self.provider = CachedProvider(self.provider, self.cache)
+
+    @staticmethod
+    def _build_prompt(text: str, instructions: str) -> str:
+        """
+        Build a prompt with the document as the leading block.
+
+        Every task run on the same document then shares an identical prompt
+        prefix, which providers with prompt caching can reuse across calls.
+
+        Args:
+            text: Document text
+            instructions: Task-specific instructions placed after the text
+
+        Returns:
+            Complete prompt
+        """
+        return f"Text:\n{text}\n\n{instructions}"
+
+    def _complete(
+        self, prompt: str, max_tokens: Optional[int] = None, json_mode: bool = False
+    ) -> str:
+        """
+        Send a prompt to the provider.
+
+        Args:
+            prompt: Complete prompt
+            max_tokens: Maximum tokens in response (defaults to self.max_tokens)
+            json_mode: Whether the response must be a single JSON object
+
+        Returns:
+            Completion text
+        """
+        max_tokens = max_tokens or self.max_tokens
+        complete = (
+            self.provider.complete_json if json_mode else self.provider.complete
+        )
+
+        return complete(prompt, temperature=self.temperature, max_tokens=max_tokens)
+
+    async def _acomplete(
+        self, prompt: str, max_tokens: Optional[int] = None, json_mode: bool = False
+    ) -> str:
+        """
+        Send a prompt to the provider using its async client.
+
+        Args:
+            prompt: Complete prompt
+            max_tokens: Maximum tokens in response (defaults to self.max_tokens)
+            json_mode: Whether the response must be a single JSON object
+
+        Returns:
+            Completion text
+        """
+        max_tokens = max_tokens or self.max_tokens
+        acomplete = (
+            self.provider.acomplete_json if json_mode else self.provider.acomplete
+        )
+
+        return await acomplete(
+            prompt, temperature=self.temperature, max_tokens=max_tokens
+        )
+
     def extract_entities(
         self, text: str, entity_types: Optional[List[str]] = None
     ) -> Dict[str, List[str]]:
@@ -74,55 +240,41 @@ class TextExtractor:
         Returns:
             Dictionary mapping entity types to lists of entities
         """
-        default_types = [
-            "people",
-            "organizations",
-            "locations",
-            "dates",
-            "money",
-            "products",
-        ]
-        types = entity_types or default_types
+        response = self._complete(self._entities_prompt(text, entity_types))
+        return self._parse_entities(response)
 
-        prompt = f"""Extract named entities from the following text and return them as a JSON object.
-
-Entity types to extract: {', '.join(types)}
-
-Text: {text}
+    async def aextract_entities(
+        self, text: str, entity_types: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Extract named entities from text using the async client.
 
-Return ONLY a valid JSON object with entity types as keys and arrays of entities as values. Example format:
-{{
-  "people": ["John Doe", "Jane Smith"],
-  "organizations": ["Company A"],
-  "locations": ["New York"],
-  "dates": ["January 2024"],
-  "money": ["$1,000"],
-  "products": ["Product X"]
-}}"""
+        Args:
+            text: Input text to extract entities from
+            entity_types: List of entity types to extract (optional)
 
-        response = self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=self.max_tokens
+        Returns:
+            Dictionary mapping entity types to lists of entities
+        """
+        response = await self._acomplete(self._entities_prompt(text, entity_types))
+        return self._parse_entities(response)
+
+    @classmethod
+    def _entities_prompt(cls, text: str, entity_types: Optional[List[str]]) -> str:
+        """Build the entity extraction prompt."""
+        if entity_types:
+            instructions = _ENTITIES_INSTRUCTIONS.format(types=", ".join(entity_types))
+        else:
+            instructions = _DEFAULT_ENTITIES_INSTRUCTIONS
+        return cls._build_prompt(text, instructions)
+
+    @staticmethod
+    def _parse_entities(response: str) -> Dict[str, List[str]]:
+        """Parse an entity extraction response."""
+        return parse_llm_json(
+            response, {"error": "Failed to parse entities", "raw_response": response}
         )
 
-        try:
-            # Parse JSON from response
-            entities = json.loads(response)
-            return entities
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to extract JSON from markdown code blocks
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {"error": "Failed to parse entities", "raw_response": response}
-
     def summarize(
         self,
         text: str,
@@ -142,32 +294,173 @@ Return ONLY a valid JSON object with entity types as keys and arrays of entities
         Returns:
             Summary text
         """
-        length_guidelines = {
-            "short": "2-3 sentences",
-            "medium": "1 paragraph (4-6 sentences)",
-            "long": "2-3 paragraphs",
-        }
+        return self._complete(self._summary_prompt(text, length, style, focus))
 
-        style_instructions = {
-            "paragraph": "Write in clear, concise paragraphs.",
-            "bullets": "Use bullet points for key information.",
-            "executive": "Write as an executive summary with key takeaways.",
-        }
+    async def asummarize(
+        self,
+        text: str,
+        length: str = "medium",
+        style: str = "paragraph",
+        focus: Optional[str] = None,
+    ) -> str:
+        """
+        Summarize a document using the async client.
 
-        focus_text = f"\nFocus particularly on: {focus}" if focus else ""
+        Args:
+            text: Text to summarize
+            length: 'short', 'medium', or 'long'
+            style: 'paragraph', 'bullets', or 'executive'
+            focus: Optional focus area for the summary
 
-        prompt = f"""Summarize the following text.
+        Returns:
+            Summary text
+        """
+        return await self._acomplete(self._summary_prompt(text, length, style, focus))
 
-Length: {length_guidelines.get(length, length_guidelines['medium'])}
-Style: {style_instructions.get(style, style_instructions['paragraph'])}{focus_text}
+    @classmethod
+    def _summary_prompt(
+        cls, text: str, length: str, style: str, focus: Optional[str]
+    ) -> str:
+        """Build the summarization prompt."""
+        instructions = f"""Summarize the text above.
 
-Text to summarize:
-{text}
+{cls._summary_options(length, style, focus)}
 
 Summary:"""
+        return cls._build_prompt(text, instructions)
+
+    def summarize_long(
+        self,
+        text: str,
+        length: str = "medium",
+        style: str = "paragraph",
+        focus: Optional[str] = None,
+        max_length: int = 4000,
+        overlap: int = 200,
+        max_workers: int = 8,
+    ) -> str:
+        """
+        Summarize a document too long for one request, map-reduce style.
+
+        The text is split with split_into_chunks, every chunk is summarized
+        concurrently, and the partial summaries are combined into the final
+        summary with one more request.
+
+        Args:
+            text: Text to summarize
+            length: 'short', 'medium', or 'long'
+            style: 'paragraph', 'bullets', or 'executive'
+            focus: Optional focus area for the summary
+            max_length: Maximum characters per chunk
+            overlap: Characters shared by consecutive chunks
+            max_workers: Maximum number of concurrent chunk requests
+
+        Returns:
+            Summary text
+
+        Raises:
+            ValueError: If max_length is not greater than overlap
+        """
+        # Each chunk must advance past the previous one's overlap
+        if max_length <= overlap:
+            raise ValueError(
+                f"max_length ({max_length}) must be greater than overlap ({overlap})"
+            )
+
+        chunks = split_into_chunks(text, max_length=max_length, overlap=overlap)
+        if len(chunks) == 1:
+            return self.summarize(text, length, style, focus)
+
+        workers = min(max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            partials = list(
+                executor.map(
+                    lambda chunk: self.summarize(chunk, "medium", "paragraph", focus),
+                    chunks,
+                )
+            )
+
+        combined = "\n\n".join(
+            f"Part {i}:\n{summary}" for i, summary in enumerate(partials, 1)
+        )
+        return self.summarize(combined, length, style, focus)
+
+    def multi_summarize(
+        self, text: str, specs: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Produce several summary variants of one document in a single request.
 
-        return self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=self.max_tokens
+        Sending the document once instead of once per variant cuts prompt
+        tokens and round trips. The response budget grows with the number and
+        length of the variants. If that budget exceeds what one response can
+        hold, or the combined response cannot be parsed, each variant is
+        requested separately with summarize().
+
+        Args:
+            text: Text to summarize
+            specs: One dict per summary with optional 'length', 'style'
+                and 'focus' keys, as accepted by summarize()
+
+        Returns:
+            List of summaries in the same order as specs
+        """
+        max_tokens = 50 + sum(
+            _SUMMARY_MAX_TOKENS.get(spec.get("length"), _SUMMARY_MAX_TOKENS["medium"])
+            for spec in specs
+        )
+        if max_tokens > _MULTI_SUMMARY_MAX_TOKENS:
+            return [self.summarize(text, **spec) for spec in specs]
+
+        variants = "\n\n".join(
+            f"Summary {i}:\n"
+            + self._summary_options(
+                spec.get("length", "medium"),
+                spec.get("style", "paragraph"),
+                spec.get("focus"),
+            )
+            for i, spec in enumerate(specs, 1)
+        )
+
+        instructions = f"""Write {len(specs)} different summaries of the text above, following each specification below.
+
+{variants}
+
+Return ONLY a valid JSON object with the summaries in the order given:
+{{"summaries": ["summary 1", "summary 2"]}}"""
+        prompt = self._build_prompt(text, instructions)
+
+        response = self._complete(prompt, max_tokens=max_tokens)
+
+        try:
+            summaries = parse_llm_json(response, {}).get("summaries")
+        except (json.JSONDecodeError, AttributeError):
+            summaries = None
+
+        if isinstance(summaries, list) and len(summaries) == len(specs):
+            return summaries
+
+        return [self.summarize(text, **spec) for spec in specs]
+
+    @staticmethod
+    def _summary_options(length: str, style: str, focus: Optional[str]) -> str:
+        """
+        Describe the requested summary length, style and focus for a prompt.
+
+        Args:
+            length: 'short', 'medium', or 'long'
+            style: 'paragraph', 'bullets', or 'executive'
+            focus: Optional focus area for the summary
+
+        Returns:
+            Prompt lines describing the summary
+        """
+        focus_text = f"\nFocus particularly on: {focus}" if focus else ""
+
+        return (
+            f"Length: {_SUMMARY_LENGTHS.get(length, _SUMMARY_LENGTHS['medium'])}\n"
+            f"Style: {_SUMMARY_STYLES.get(style, _SUMMARY_STYLES['paragraph'])}"
+            f"{focus_text}"
         )
 
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
@@ -180,83 +473,165 @@ Summary:"""
         Returns:
             Dictionary with sentiment analysis results
         """
-        prompt = f"""Analyze the sentiment and emotional tone of the following text.
+        response = self._complete(self._sentiment_prompt(text))
+        return self._parse_sentiment(response)
 
-Text: {text}
-
-Return a JSON object with:
-- overall_sentiment: "positive", "negative", or "neutral"
-- confidence: 0.0 to 1.0
-- emotions: list of detected emotions
-- key_phrases: list of phrases that influenced the sentiment
-- reasoning: brief explanation
+    async def aanalyze_sentiment(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment and emotional tone of text using the async client.
 
-Return ONLY valid JSON:"""
+        Args:
+            text: Text to analyze
 
-        response = self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=self.max_tokens
+        Returns:
+            Dictionary with sentiment analysis results
+        """
+        response = await self._acomplete(self._sentiment_prompt(text))
+        return self._parse_sentiment(response)
+
+    @classmethod
+    def _sentiment_prompt(cls, text: str) -> str:
+        """Build the sentiment analysis prompt."""
+        return cls._build_prompt(text, _SENTIMENT_INSTRUCTIONS)
+
+    @staticmethod
+    def _parse_sentiment(response: str) -> Dict[str, Any]:
+        """Parse a sentiment analysis response."""
+        return parse_llm_json(
+            response, {"error": "Failed to parse sentiment", "raw_response": response}
         )
 
-        try:
-            sentiment = json.loads(response)
-            return sentiment
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {"error": "Failed to parse sentiment", "raw_response": response}
-
     def extract_structured_data(
-        self, text: str, schema: Dict[str, Any]
+        self, text: str, schema: Union[Dict[str, Any], str]
     ) -> Dict[str, Any]:
         """
         Extract structured data based on a provided schema.
 
         Args:
             text: Text to extract data from
-            schema: JSON schema describing the desired output structure
+            schema: JSON schema describing the desired output structure, or
+                the schema already serialized as JSON text
 
         Returns:
             Extracted data matching the schema
         """
-        prompt = f"""Extract structured data from the following text according to the provided schema.
+        # The schema always describes a JSON object, so request JSON mode and
+        # skip the fenced-block fallback on well-behaved providers
+        response = self._complete(
+            self._structured_data_prompt(text, schema), json_mode=True
+        )
+        return self._parse_structured_data(response)
 
-Schema:
-{json.dumps(schema, indent=2)}
+    async def aextract_structured_data(
+        self, text: str, schema: Union[Dict[str, Any], str]
+    ) -> Dict[str, Any]:
+        """
+        Extract structured data based on a provided schema using the async client.
+
+        Args:
+            text: Text to extract data from
+            schema: JSON schema describing the desired output structure, or
+                the schema already serialized as JSON text
 
-Text:
-{text}
+        Returns:
+            Extracted data matching the schema
+        """
+        response = await self._acomplete(
+            self._structured_data_prompt(text, schema), json_mode=True
+        )
+        return self._parse_structured_data(response)
+
+    def stream_structured_data(
+        self, text: str, schema: Union[Dict[str, Any], str]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Extract structured data, yielding each top-level field once it is complete.
+
+        The response is streamed and parsed as it arrives. A field is
+        complete as soon as the next one starts, so consumers can act on
+        early fields while later ones are still being generated.
+
+        Args:
+            text: Text to extract data from
+            schema: JSON schema describing the desired output structure, or
+                the schema already serialized as JSON text
+
+        Yields:
+            (field, value) pairs of the extracted object, in response order.
+            If the full response cannot be parsed, the fields received so far
+            are followed by "error" and "raw_response" entries.
+        """
+        received = []
+        yielded = set()
+
+        for chunk in self.provider.stream(
+            self._structured_data_prompt(text, schema),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        ):
+            received.append(chunk)
+            # A value can only have been completed by one of these characters
+            if not any(char in chunk for char in ",]}"):
+                continue
+            partial = parse_partial_json("".join(received))
+            if isinstance(partial, dict):
+                for key in list(partial)[:-1]:
+                    if key not in yielded:
+                        yielded.add(key)
+                        yield key, partial[key]
+
+        response = "".join(received)
+        data = parse_llm_json(response)
+        if not isinstance(data, dict):
+            # The response was cut off or malformed: flush the fields that did
+            # arrive, then report the failure as extract_structured_data does
+            partial = parse_partial_json(response)
+            data = partial if isinstance(partial, dict) else {}
+            data.update(error="Failed to parse data", raw_response=response)
+
+        for key, value in data.items():
+            if key not in yielded:
+                yield key, value
+
+    @classmethod
+    def _structured_data_prompt(
+        cls, text: str, schema: Union[Dict[str, Any], str]
+    ) -> str:
+        """
+        Build the structured data extraction prompt.
+
+        Args:
+            text: Text to extract data from
+            schema: Schema dict or its JSON serialization
+
+        Returns:
+            Complete prompt
+        """
+        if not isinstance(schema, str):
+            schema = to_json(schema, indent=True)
+
+        instructions = f"""Extract structured data from the text above according to the provided schema.
+
+Schema:
+{schema}
 
 Return ONLY valid JSON matching the schema:"""
+        return cls._build_prompt(text, instructions)
 
-        response = self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=self.max_tokens
-        )
+    @staticmethod
+    def _parse_structured_data(response: str) -> Dict[str, Any]:
+        """
+        Parse a structured data response.
 
-        try:
-            data = json.loads(response)
-            return data
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {"error": "Failed to parse data", "raw_response": response}
+        Args:
+            response: Raw LLM response
+
+        Returns:
+            Extracted data, or an error entry with the raw response
+        """
+        return parse_llm_json(
+            response, {"error": "Failed to parse data", "raw_response": response}
+        )
 
     def classify_text(
         self, text: str, categories: List[str], multi_label: bool = False
@@ -272,48 +647,54 @@ Return ONLY valid JSON matching the schema:"""
         Returns:
             Single category or list of categories
         """
-        multi_label_instruction = (
-            "The text can belong to multiple categories."
-            if multi_label
-            else "Choose only ONE category that best fits."
+        response = self._complete(
+            self._classify_prompt(text, categories, multi_label), max_tokens=500
         )
+        return self._parse_classification(response, multi_label)
 
-        prompt = f"""Classify the following text into one or more of these categories:
-{', '.join(categories)}
-
-{multi_label_instruction}
-
-Text: {text}
+    async def aclassify_text(
+        self, text: str, categories: List[str], multi_label: bool = False
+    ) -> Union[str, List[str]]:
+        """
+        Classify text into predefined categories using the async client.
 
-Return your answer as a JSON object:
-{{"categories": ["category1", "category2"]}} for multi-label
-OR
-{{"category": "category1"}} for single-label
+        Args:
+            text: Text to classify
+            categories: List of possible categories
+            multi_label: Whether to allow multiple categories
 
-Return ONLY valid JSON:"""
+        Returns:
+            Single category or list of categories
+        """
+        response = await self._acomplete(
+            self._classify_prompt(text, categories, multi_label), max_tokens=500
+        )
+        return self._parse_classification(response, multi_label)
 
-        response = self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=500
+    @classmethod
+    def _classify_prompt(
+        cls, text: str, categories: List[str], multi_label: bool
+    ) -> str:
+        """Build the classification prompt."""
+        instructions = _CLASSIFY_INSTRUCTIONS.format(
+            categories=", ".join(categories),
+            label_instruction=(
+                "The text can belong to multiple categories."
+                if multi_label
+                else "Choose only ONE category that best fits."
+            ),
         )
+        return cls._build_prompt(text, instructions)
 
-        try:
-            result = json.loads(response)
-            if multi_label:
-                return result.get("categories", [])
-            else:
-                return result.get("category", "")
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                result = json.loads(json_str)
-                if multi_label:
-                    return result.get("categories", [])
-                else:
-                    return result.get("category", "")
-            else:
-                return [] if multi_label else ""
+    @staticmethod
+    def _parse_classification(
+        response: str, multi_label: bool
+    ) -> Union[str, List[str]]:
+        """Parse a classification response."""
+        result = parse_llm_json(response, {})
+        if multi_label:
+            return result.get("categories", [])
+        return result.get("category", "")
 
     def extract_key_information(
         self, text: str, information_types: List[str]
@@ -328,32 +709,100 @@ Return ONLY valid JSON:"""
         Returns:
             Dictionary with extracted information
         """
-        prompt = f"""Extract the following information from the text:
-{', '.join(information_types)}
+        response = self._complete(
+            self._key_information_prompt(text, information_types)
+        )
+        return self._parse_key_information(response)
 
-Text:
-{text}
+    async def aextract_key_information(
+        self, text: str, information_types: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Extract specific types of information from text using the async client.
 
-Return the extracted information as a JSON object with the information types as keys.
-Return ONLY valid JSON:"""
+        Args:
+            text: Text to extract from
+            information_types: Types of information to extract
+
+        Returns:
+            Dictionary with extracted information
+        """
+        response = await self._acomplete(
+            self._key_information_prompt(text, information_types)
+        )
+        return self._parse_key_information(response)
 
-        response = self.provider.complete(
-            prompt, temperature=self.temperature, max_tokens=self.max_tokens
+    @classmethod
+    def _key_information_prompt(cls, text: str, information_types: List[str]) -> str:
+        """Build the key information extraction prompt."""
+        instructions = _KEY_INFORMATION_INSTRUCTIONS.format(
+            types=", ".join(information_types)
+        )
+        return cls._build_prompt(text, instructions)
+
+    @staticmethod
+    def _parse_key_information(response: str) -> Dict[str, Any]:
+        """Parse a key information extraction response."""
+        return parse_llm_json(
+            response,
+            {"error": "Failed to parse information", "raw_response": response},
         )
 
-        try:
-            info = json.loads(response)
-            return info
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                json_str = response[json_start:json_end].strip()
-                return json.loads(json_str)
-            else:
-                return {"error": "Failed to parse information", "raw_response": response}
+    async def abatch(
+        self, calls: List[Tuple[str, Dict[str, Any]]], max_parallel: int = 8
+    ) -> List[Any]:
+        """
+        Run several extraction calls concurrently.
+
+        At most max_parallel requests are in flight at once, so large batches
+        stay within provider rate limits.
+
+        Args:
+            calls: (method name, keyword arguments) pairs, for example
+                ("summarize", {"text": document, "length": "short"})
+            max_parallel: Maximum number of concurrent requests
+
+        Returns:
+            Results in the same order as calls; a call that failed is
+            represented by the exception it raised
+
+        Raises:
+            ValueError: If a method name is not supported
+        """
+        for method, _ in calls:
+            if method not in _BATCH_METHODS:
+                raise ValueError(
+                    f"Unsupported batch method: {method}. "
+                    f"Use one of: {', '.join(sorted(_BATCH_METHODS))}."
+                )
+
+        semaphore = asyncio.Semaphore(max_parallel)
+
+        async def run(method: str, kwargs: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await getattr(self, f"a{method}")(**kwargs)
+
+        return await asyncio.gather(
+            *(run(method, kwargs) for method, kwargs in calls),
+            return_exceptions=True,
+        )
+
+    def batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]], max_parallel: int = 8
+    ) -> List[Any]:
+        """
+        Run abatch from synchronous code.
+
+        The batch runs in its own event loop, whose async clients are closed
+        when it finishes. Must not be called while an event loop is running;
+        await abatch directly in that case.
+
+        Args:
+            calls: (method name, keyword arguments) pairs
+            max_parallel: Maximum number of concurrent requests
+
+        Returns:
+            Results in the same order as calls, with exceptions in place of
+            failed calls
+        """
+        return run_async(self.abatch(calls, max_parallel))
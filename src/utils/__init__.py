@@ -3,25 +3,38 @@ Utility functions for text processing.
 """
 
 from .text_utils import (
+    PrescanCache,
+    prescan,
     clean_text,
     split_into_chunks,
     extract_emails,
     extract_phone_numbers,
     extract_urls,
+    extract_contacts,
     calculate_readability_score,
+    estimate_tokens,
     truncate_text,
     remove_special_characters,
     find_keywords,
 )
+from .json_utils import to_json, from_json, parse_llm_json, parse_partial_json
 
 __all__ = [
+    "PrescanCache",
+    "prescan",
     "clean_text",
     "split_into_chunks",
     "extract_emails",
     "extract_phone_numbers",
     "extract_urls",
+    "extract_contacts",
     "calculate_readability_score",
+    "estimate_tokens",
     "truncate_text",
     "remove_special_characters",
     "find_keywords",
+    "to_json",
+    "from_json",
+    "parse_llm_json",
+    "parse_partial_json",
 ]
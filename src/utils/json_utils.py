@@ -0,0 +1,145 @@
+"""
+JSON serialization helpers.
+
+orjson is used when it is installed and is several times faster than the
+standard library; otherwise these helpers fall back to the json module with
+equivalent output.
+"""
+
+import json
+import re
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A JSON object or array inside a markdown code fence, optionally tagged json
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+
+
+def to_json(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Whether to pretty-print with two-space indentation
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def from_json(text: str) -> Any:
+    """
+    Parse a JSON string.
+
+    Args:
+        text: JSON text
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON (orjson's error type
+            is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def parse_llm_json(response: str, default: Any = None) -> Any:
+    """
+    Parse JSON from an LLM response, unwrapping a markdown code fence if needed.
+
+    Args:
+        response: Raw LLM response
+        default: Value returned when the response holds no JSON block
+
+    Returns:
+        Parsed JSON value or default
+
+    Raises:
+        json.JSONDecodeError: If a fenced block is found but is not valid JSON
+    """
+    try:
+        return from_json(response)
+    except json.JSONDecodeError:
+        match = _JSON_FENCE_RE.search(response)
+        if match is None:
+            return default
+        return from_json(match.group(1))
+
+
+def parse_partial_json(text: str) -> Optional[Any]:
+    """
+    Parse the complete part of a JSON object or array that is still streaming.
+
+    The text is cut after the last fully received value and the brackets that
+    are still open are closed, so a truncated response such as
+    '{"skills": ["Python", "SQ' parses as {"skills": ["Python"]}. Text before
+    the first "{" or "[" (such as a code fence) is ignored.
+
+    Args:
+        text: Response text received so far
+
+    Returns:
+        Parsed value, or None if no value has been completed yet
+    """
+    try:
+        return from_json(text)
+    except json.JSONDecodeError:
+        pass
+
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    if not starts:
+        return None
+
+    closers = []
+    cut = None
+    in_string = False
+    escaped = False
+
+    for i in range(min(starts), len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            closers.append("}")
+        elif char == "[":
+            closers.append("]")
+        elif char in "}]":
+            if not closers:
+                break
+            closers.pop()
+            cut = (i + 1, "".join(reversed(closers)))
+            if not closers:
+                break
+        elif char == ",":
+            cut = (i, "".join(reversed(closers)))
+
+    if cut is None:
+        return None
+
+    end, suffix = cut
+    try:
+        return from_json(text[min(starts):end] + suffix)
+    except json.JSONDecodeError:
+        return None
@@ -2,27 +2,272 @@
 Text processing utilities.
 """
 
+import bisect
 import re
-from typing import List, Dict, Any
+from collections import Counter
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# google-re2 matches in linear time without backtracking, which makes the
+# contact scans cheaper on long documents. Fall back to the standard library
+# engine when it is not installed.
+try:
+    import re2 as _contact_re
+except ImportError:
+    _contact_re = re
+
+# Regex patterns compiled once at import time and reused across calls
+_EMAIL_RE = _contact_re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+# US format with an optional international prefix, matched in one pass
+_PHONE_RE = _contact_re.compile(
+    r"(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}"
+)
+_URL_RE = _contact_re.compile(r"https?://[^\s<>\"{}|\\^`\[\]]+")
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_RE = re.compile(r"[^.!?\s][^.!?]*")
+_CHUNK_BOUNDARY_RE = re.compile(r"[.\n]")
+
+# clean_text and find_keywords memoize results for repeated inputs. Inputs
+# longer than _MEMO_MAX_LENGTH characters bypass the memo, which bounds
+# each cache at roughly _MEMO_MAXSIZE * _MEMO_MAX_LENGTH characters of keys
+_MEMO_MAXSIZE = 256
+_MEMO_MAX_LENGTH = 100_000
+
+# str.translate table for keyword tokens: lowercases ASCII letters and
+# deletes every other ASCII character except whitespace
+_KEYWORD_TABLE = {
+    code: chr(code).lower() if chr(code).isupper() else None
+    for code in range(128)
+    if not (chr(code).islower() or chr(code).isspace())
+}
+
+
+class _VowelMask(dict):
+    """
+    str.translate table that maps vowels to "a" and everything else to " ".
 
+    Characters other than vowels are added on first lookup, so later
+    translations of the same characters stay entirely in C.
+    """
 
-def clean_text(text: str) -> str:
+    def __missing__(self, code: int) -> str:
+        self[code] = " "
+        return " "
+
+
+# Turns a lowercased word into vowel runs separated by spaces
+_VOWEL_MASK = _VowelMask({ord(char): "a" for char in "aeiouy"})
+
+
+class _CharFilter(dict):
+    """
+    str.translate table that deletes characters failing a predicate.
+
+    Entries are added on first lookup (kept characters map to themselves),
+    so repeated characters are translated entirely in C.
     """
-    Clean and normalize text.
+
+    def __init__(self, keep: Callable[[str], bool]):
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, code: int) -> Optional[str]:
+        char = chr(code)
+        value = char if self.keep(char) else None
+        self[code] = value
+        return value
+
+
+# remove_special_characters keeps ASCII letters and digits, plus whitespace
+# (matching the regex \s) when spaces are kept
+_KEEP_ALNUM_SPACE = _CharFilter(
+    lambda char: (char.isascii() and char.isalnum()) or char.isspace()
+)
+_KEEP_ALNUM = _CharFilter(lambda char: char.isascii() and char.isalnum())
+
+# Flesch Reading Ease lower bounds; a score at or above _READING_THRESHOLDS[i]
+# and below the next threshold maps to _READING_LEVELS[i + 1]
+_READING_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_READING_LEVELS = (
+    "Very Difficult (College graduate)",
+    "Difficult (College)",
+    "Fairly Difficult (10th-12th grade)",
+    "Standard (8th-9th grade)",
+    "Fairly Easy (7th grade)",
+    "Easy (6th grade)",
+    "Very Easy (5th grade)",
+)
+
+# calculate_readability_score result for blank text (copied before returning)
+_EMPTY_READABILITY = {
+    "word_count": 0,
+    "sentence_count": 0,
+    "avg_words_per_sentence": 0.0,
+    "avg_syllables_per_word": 0.0,
+    "reading_ease": 0,
+    "reading_level": _READING_LEVELS[0],
+}
+
+# Common stop words ignored by find_keywords
+STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "as",
+        "is",
+        "was",
+        "are",
+        "been",
+        "be",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "should",
+        "could",
+        "may",
+        "might",
+        "must",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "what",
+        "which",
+        "who",
+        "when",
+        "where",
+        "why",
+        "how",
+    }
+)
+
+
+class PrescanCache:
+    """
+    Tokenization results for one document, shared by the analysis helpers.
+
+    Each result is computed on first access and then reused, so a helper
+    only pays for the tokenization it needs and callers never repeat it.
+    """
+
+    def __init__(self, text: str):
+        """
+        Initialize the cache.
+
+        Args:
+            text: Document text
+        """
+        self.text = text
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated words of the text."""
+        return self.text.split()
+
+    @cached_property
+    def sentence_count(self) -> int:
+        """Number of non-empty sentences in the text."""
+        return _count_sentences(self.text)
+
+    @cached_property
+    def keyword_tokens(self) -> List[str]:
+        """Lowercased, letter-only tokens used for keyword extraction."""
+        return _keyword_tokens(self.text)
+
+
+def prescan(text: str) -> PrescanCache:
+    """
+    Prepare a document for tokenization shared across several helpers.
 
     Args:
-        text: Input text to clean
+        text: Text to scan
 
     Returns:
-        Cleaned text
+        PrescanCache whose words, sentence count and keyword tokens are
+        each computed once, on first use
     """
+    return PrescanCache(text)
+
+
+def _count_sentences(text: str) -> int:
+    """Count non-empty sentences in text."""
+    # Each match is one run of text between terminators that contains a
+    # non-whitespace character, so no list of sentence strings is built
+    return sum(1 for _ in _SENTENCE_RE.finditer(text))
+
+
+def _keyword_tokens(text: str) -> List[str]:
+    """Lowercase text and split it into letter-only tokens."""
+    # Lowercase ASCII letters and drop other ASCII non-whitespace characters
+    # in one C-level pass, then split into words
+    words = text.translate(_KEYWORD_TABLE).split()
+    if text.isascii():
+        return words
+
+    # Non-ASCII words still need Unicode lowercasing before stripping
+    cleaned = (
+        word if word.isascii() else _NON_ALPHA_RE.sub("", word.lower())
+        for word in words
+    )
+    return [word for word in cleaned if word]
+
+
+def _clean_text(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends."""
     # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     # Remove leading/trailing whitespace
     text = text.strip()
     return text
 
 
+_clean_text_cached = lru_cache(maxsize=_MEMO_MAXSIZE)(_clean_text)
+
+
+def clean_text(text: str) -> str:
+    """
+    Clean and normalize text.
+
+    Args:
+        text: Input text to clean
+
+    Returns:
+        Cleaned text
+    """
+    # Pipelines often clean the same document several times; memoize all
+    # but very long inputs, which would pin too much memory in the cache
+    if len(text) > _MEMO_MAX_LENGTH:
+        return _clean_text(text)
+    return _clean_text_cached(text)
+
+
 def split_into_chunks(text: str, max_length: int = 4000, overlap: int = 200) -> List[str]:
     """
     Split text into chunks for processing.
@@ -38,25 +283,26 @@ def split_into_chunks(text: str, max_length: int = 4000, overlap: int = 200) ->
     if len(text) <= max_length:
         return [text]
 
+    # Positions of every sentence boundary, found in one scan so each chunk
+    # only needs a binary search instead of rescanning its window
+    boundaries = [match.start() for match in _CHUNK_BOUNDARY_RE.finditer(text)]
+
     chunks = []
     start = 0
 
     while start < len(text):
         end = start + max_length
-        chunk = text[start:end]
 
-        # Try to break at sentence boundary
+        # Try to break at the last sentence boundary inside the window, but
+        # only when the next chunk still starts after this one; otherwise cut
+        # hard at the window end
         if end < len(text):
-            last_period = chunk.rfind(".")
-            last_newline = chunk.rfind("\n")
-            break_point = max(last_period, last_newline)
+            index = bisect.bisect_left(boundaries, end) - 1
+            if index >= 0 and boundaries[index] + 1 - overlap > start:
+                end = boundaries[index] + 1
 
-            if break_point > 0:
-                end = start + break_point + 1
-                chunk = text[start:end]
-
-        chunks.append(chunk)
-        start = end - overlap
+        chunks.append(text[start:end])
+        start = max(end - overlap, 0)
 
     return chunks
 
@@ -71,8 +317,10 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of email addresses
     """
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    return re.findall(email_pattern, text)
+    # Every match contains "@"; skip the regex scan when it cannot match
+    if "@" not in text:
+        return []
+    return _EMAIL_RE.findall(text)
 
 
 def extract_phone_numbers(text: str) -> List[str]:
@@ -85,17 +333,8 @@ def extract_phone_numbers(text: str) -> List[str]:
     Returns:
         List of phone numbers
     """
-    # Match various phone number formats
-    patterns = [
-        r"\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # International
-        r"\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",  # US format
-    ]
-
-    phone_numbers = []
-    for pattern in patterns:
-        phone_numbers.extend(re.findall(pattern, text))
-
-    return list(set(phone_numbers))  # Remove duplicates
+    # Remove duplicates, keeping numbers in order of first appearance
+    return list(dict.fromkeys(_PHONE_RE.findall(text)))
 
 
 def extract_urls(text: str) -> List[str]:
@@ -108,30 +347,64 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs
     """
-    url_pattern = r"https?://[^\s<>\"{}|\\^`\[\]]+"
-    return re.findall(url_pattern, text)
+    # Every match contains "://"; skip the regex scan when it cannot match
+    if "://" not in text:
+        return []
+    return _URL_RE.findall(text)
 
 
-def calculate_readability_score(text: str) -> Dict[str, Any]:
+def extract_contacts(text: str) -> Dict[str, List[str]]:
+    """
+    Extract emails, phone numbers and URLs from text in one call.
+
+    Each type keeps its own scan and literal prefilter, so text without
+    "@" or "://" is only walked by the phone pattern.
+
+    Args:
+        text: Text to extract contact details from
+
+    Returns:
+        Dictionary with "emails", "phone_numbers" and "urls" lists
+    """
+    return {
+        "emails": extract_emails(text),
+        "phone_numbers": extract_phone_numbers(text),
+        "urls": extract_urls(text),
+    }
+
+
+def calculate_readability_score(
+    text: str, cache: Optional[PrescanCache] = None
+) -> Dict[str, Any]:
     """
     Calculate basic readability metrics.
 
     Args:
         text: Text to analyze
+        cache: Optional prescan of text to reuse instead of re-tokenizing
 
     Returns:
         Dictionary with readability metrics
     """
-    # Count sentences
-    sentences = re.split(r"[.!?]+", text)
-    sentence_count = len([s for s in sentences if s.strip()])
+    # Blank text has no words or sentences; skip tokenization entirely
+    if not text or text.isspace():
+        return dict(_EMPTY_READABILITY)
+
+    if cache is not None:
+        sentence_count = cache.sentence_count
+        words = cache.words
+    else:
+        sentence_count = _count_sentences(text)
+        words = text.split()
 
-    # Count words
-    words = text.split()
     word_count = len(words)
 
-    # Count syllables (simplified)
-    syllable_count = sum(count_syllables(word) for word in words)
+    # Count syllables (simplified). Words repeat heavily in long documents,
+    # so count each distinct word once and weight it by its frequency.
+    syllable_count = sum(
+        count_syllables(word) * frequency
+        for word, frequency in Counter(words).items()
+    )
 
     # Calculate metrics
     avg_words_per_sentence = word_count / max(sentence_count, 1)
@@ -157,6 +430,9 @@ def calculate_readability_score(text: str) -> Dict[str, Any]:
     }
 
 
+# Vocabulary repeats across documents, so per-word results are kept between
+# calls; calculate_readability_score only looks up each distinct word once
+@lru_cache(maxsize=65536)
 def count_syllables(word: str) -> int:
     """
     Count syllables in a word (simplified).
@@ -168,15 +444,9 @@ def count_syllables(word: str) -> int:
         Number of syllables
     """
     word = word.lower()
-    vowels = "aeiouy"
-    syllable_count = 0
-    previous_was_vowel = False
 
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
+    # Each run of consecutive vowels counts as one syllable
+    syllable_count = len(word.translate(_VOWEL_MASK).split())
 
     # Adjust for silent e
     if word.endswith("e"):
@@ -196,20 +466,23 @@ def get_reading_level(reading_ease: float) -> str:
     Returns:
         Reading level description
     """
-    if reading_ease >= 90:
-        return "Very Easy (5th grade)"
-    elif reading_ease >= 80:
-        return "Easy (6th grade)"
-    elif reading_ease >= 70:
-        return "Fairly Easy (7th grade)"
-    elif reading_ease >= 60:
-        return "Standard (8th-9th grade)"
-    elif reading_ease >= 50:
-        return "Fairly Difficult (10th-12th grade)"
-    elif reading_ease >= 30:
-        return "Difficult (College)"
-    else:
-        return "Very Difficult (College graduate)"
+    return _READING_LEVELS[bisect.bisect_right(_READING_THRESHOLDS, reading_ease)]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Uses the common approximation of four characters per token, which is
+    provider independent and needs no tokenizer.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count, rounded up
+    """
+    return (len(text) + 3) // 4
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -227,7 +500,12 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     if len(text) <= max_length:
         return text
 
-    return text[: max_length - len(suffix)].strip() + suffix
+    # strip() only walks inward from both ends and returns the slice itself
+    # when there is nothing to trim, so this is one slice plus the concat.
+    # The cut is clamped so a suffix longer than max_length never turns it
+    # into a negative index.
+    cut = max(max_length - len(suffix), 0)
+    return text[:cut].strip() + suffix
 
 
 def remove_special_characters(text: str, keep_spaces: bool = True) -> str:
@@ -241,90 +519,45 @@ def remove_special_characters(text: str, keep_spaces: bool = True) -> str:
     Returns:
         Text with special characters removed
     """
-    if keep_spaces:
-        return re.sub(r"[^a-zA-Z0-9\s]", "", text)
-    else:
-        return re.sub(r"[^a-zA-Z0-9]", "", text)
+    return text.translate(_KEEP_ALNUM_SPACE if keep_spaces else _KEEP_ALNUM)
 
 
-def find_keywords(text: str, top_n: int = 10) -> List[str]:
+def find_keywords(
+    text: str, top_n: int = 10, cache: Optional[PrescanCache] = None
+) -> List[str]:
     """
     Extract top keywords from text (simple frequency-based).
 
     Args:
         text: Text to extract keywords from
         top_n: Number of top keywords to return
+        cache: Optional prescan of text to reuse instead of re-tokenizing
 
     Returns:
         List of top keywords
     """
-    # Remove common stop words
-    stop_words = {
-        "the",
-        "a",
-        "an",
-        "and",
-        "or",
-        "but",
-        "in",
-        "on",
-        "at",
-        "to",
-        "for",
-        "of",
-        "with",
-        "by",
-        "from",
-        "as",
-        "is",
-        "was",
-        "are",
-        "been",
-        "be",
-        "have",
-        "has",
-        "had",
-        "do",
-        "does",
-        "did",
-        "will",
-        "would",
-        "should",
-        "could",
-        "may",
-        "might",
-        "must",
-        "can",
-        "this",
-        "that",
-        "these",
-        "those",
-        "i",
-        "you",
-        "he",
-        "she",
-        "it",
-        "we",
-        "they",
-        "what",
-        "which",
-        "who",
-        "when",
-        "where",
-        "why",
-        "how",
-    }
-
-    # Tokenize and clean
-    words = text.lower().split()
-    words = [re.sub(r"[^a-z]", "", word) for word in words]
-    words = [word for word in words if word and word not in stop_words and len(word) > 2]
-
-    # Count frequencies
-    word_freq = {}
-    for word in words:
-        word_freq[word] = word_freq.get(word, 0) + 1
-
-    # Get top N
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, _ in sorted_words[:top_n]]
+    # A prescan already holds the tokens, so only uncached calls on inputs
+    # of bounded size go through the memo
+    if cache is not None:
+        return _top_keywords(cache.keyword_tokens, top_n)
+    if len(text) > _MEMO_MAX_LENGTH:
+        return _top_keywords(_keyword_tokens(text), top_n)
+    # Copy the memoized tuple so callers can modify the list they get back
+    return list(_find_keywords_cached(text, top_n))
+
+
+def _top_keywords(words: List[str], top_n: int) -> List[str]:
+    """Return the top_n most frequent words that are not stop words."""
+    # Count frequencies in C, skipping stop words and very short words
+    word_freq = Counter(
+        word for word in words if len(word) > 2 and word not in STOP_WORDS
+    )
+
+    # most_common selects the top N with a heap instead of a full sort
+    return [word for word, _ in word_freq.most_common(top_n)]
+
+
+@lru_cache(maxsize=_MEMO_MAXSIZE)
+def _find_keywords_cached(text: str, top_n: int) -> Tuple[str, ...]:
+    """Memoized keyword extraction for texts without a prescan."""
+    return tuple(_top_keywords(_keyword_tokens(text), top_n))
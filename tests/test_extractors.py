@@ -2,11 +2,58 @@
 Tests for text extraction functionality.
 """
 
+import asyncio
+
+import httpx
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from src.text_extractor import TextExtractor
 from src.extractors.invoice_extractor import InvoiceExtractor
-from src.extractors.resume_extractor import ResumeExtractor
+from src.extractors.resume_extractor import _CONTACT_INFO_MAX_TOKENS, ResumeExtractor
+from src.providers.anthropic_provider import AnthropicProvider
+from src.providers.openai_provider import OpenAIProvider
+from src.providers.cache import CachedProvider, ResponseCache
+from src.utils.json_utils import parse_partial_json, to_json
+from src.utils.text_utils import estimate_tokens
+
+
+def stub_async_http_clients(content, http_clients):
+    """
+    Patch the async HTTP client factory with clients that answer every
+    request with a chat completion whose message is content.
+
+    Args:
+        content: Message content of every response
+        http_clients: List that receives each client created
+
+    Returns:
+        Patch context manager
+    """
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    def new_client():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        http_clients.append(client)
+        return client
+
+    return patch("src.providers.clients._new_async_http_client", side_effect=new_client)
 
 
 class TestTextExtractor:
@@ -30,6 +77,21 @@ class TestTextExtractor:
             extractor = TextExtractor(provider="anthropic")
             assert extractor.provider_name == "anthropic"
 
+    def test_providers_share_sdk_client(self):
+        """Test that providers with the same API key reuse one SDK client."""
+        first = TextExtractor(provider="openai", api_key="test-key")
+        second = TextExtractor(provider="openai", api_key="test-key")
+        assert first.provider.client is second.provider.client
+
+    def test_providers_share_http_pool(self):
+        """Test that SDK clients for different providers share one HTTP pool."""
+        openai_extractor = TextExtractor(provider="openai", api_key="test-key")
+        anthropic_extractor = TextExtractor(provider="anthropic", api_key="test-key")
+        assert (
+            openai_extractor.provider.client._client
+            is anthropic_extractor.provider.client._client
+        )
+
     def test_invalid_provider(self):
         """Test that invalid provider raises ValueError."""
         with pytest.raises(ValueError):
@@ -64,6 +126,120 @@ class TestTextExtractor:
 
             assert result == "This is a test summary."
 
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_summarize_long_maps_chunks_then_reduces(self, mock_provider):
+        """Test that chunk summaries are combined by one final request."""
+        mock_instance = Mock()
+        mock_instance.complete.side_effect = lambda prompt, **kwargs: (
+            "Final summary." if "Part 1:" in prompt else "Chunk summary."
+        )
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            text = "A sentence about the topic. " * 20
+            summary = extractor.summarize_long(text, length="short", max_length=300)
+
+            assert summary == "Final summary."
+            prompts = [c.args[0] for c in mock_instance.complete.call_args_list]
+            assert sum("Part 1:" in prompt for prompt in prompts) == 1
+            assert len(prompts) > 2
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_summarize_long_small_chunks(self, mock_provider):
+        """Test that small chunk sizes either finish or are rejected up front."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = "Summary."
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            text = "A sentence about the topic. " * 20
+
+            with pytest.raises(ValueError):
+                extractor.summarize_long(text, max_length=150)
+            mock_instance.complete.assert_not_called()
+
+            summary = extractor.summarize_long(text, max_length=100, overlap=10)
+            assert summary == "Summary."
+            assert mock_instance.complete.call_count > 2
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_multi_summarize_single_request(self, mock_provider):
+        """Test that all summary variants come from one request."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = (
+            '{"summaries": ["Short one.", "- Bullet one"]}'
+        )
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.multi_summarize(
+                "Long text here", specs=[{"length": "short"}, {"style": "bullets"}]
+            )
+
+            assert result == ["Short one.", "- Bullet one"]
+            assert mock_instance.complete.call_count == 1
+            # 200 for the short variant, 400 for the medium default, plus 50
+            assert mock_instance.complete.call_args.kwargs["max_tokens"] == 650
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_multi_summarize_truncated_response_falls_back(self, mock_provider):
+        """Test that a cut-off combined response is retried per variant."""
+        mock_instance = Mock()
+        mock_instance.complete.side_effect = [
+            '{"summaries": ["Short one.", "The long summary was cut',
+            "Short one.",
+            "Long one.",
+        ]
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.multi_summarize(
+                "Long text here", specs=[{"length": "short"}, {"length": "long"}]
+            )
+
+            assert result == ["Short one.", "Long one."]
+            max_tokens = [
+                c.kwargs["max_tokens"] for c in mock_instance.complete.call_args_list
+            ]
+            assert max_tokens[0] == 1250
+            assert len(max_tokens) == 3
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_multi_summarize_over_budget_skips_combined_request(self, mock_provider):
+        """Test that variants too long for one response are requested separately."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = "Summary."
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.multi_summarize(
+                "Long text here", specs=[{"length": "long"}] * 6
+            )
+
+            assert result == ["Summary."] * 6
+            assert mock_instance.complete.call_count == 6
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_multi_summarize_falls_back_per_spec(self, mock_provider):
+        """Test fallback to one request per variant on unparseable output."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = "Not JSON"
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.multi_summarize(
+                "Long text here", specs=[{"length": "short"}, {"length": "long"}]
+            )
+
+            assert result == ["Not JSON", "Not JSON"]
+            assert mock_instance.complete.call_count == 3
+
     @patch("src.text_extractor.OpenAIProvider")
     def test_analyze_sentiment(self, mock_provider):
         """Test sentiment analysis."""
@@ -101,6 +277,274 @@ class TestTextExtractor:
 
             assert result == "technology"
 
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_classify_text_fenced_response(self, mock_provider):
+        """Test that a fenced classification response without a tag is parsed."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = (
+            'Here are the labels:\n```\n{"categories": ["technology", "politics"]}\n```'
+        )
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.classify_text(
+                "AI policy news",
+                categories=["technology", "sports", "politics"],
+                multi_label=True,
+            )
+
+            assert result == ["technology", "politics"]
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_extract_structured_data_uses_json_mode(self, mock_provider):
+        """Test that structured extraction requests JSON mode."""
+        mock_instance = Mock()
+        mock_instance.complete_json.return_value = '{"title": "Report"}'
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            result = extractor.extract_structured_data(
+                "Report text", schema={"title": "string"}
+            )
+
+            assert result == {"title": "Report"}
+            mock_instance.complete.assert_not_called()
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_structured_data_sync_and_async_send_same_request(self, mock_provider):
+        """Test that the sync and async paths use the same JSON request."""
+        mock_instance = Mock()
+        mock_instance.complete_json.return_value = '{"title": "Report"}'
+        mock_instance.acomplete_json = AsyncMock(return_value='{"title": "Report"}')
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            schema = {"title": "string"}
+            sync_result = extractor.extract_structured_data("Report text", schema)
+            async_result = asyncio.run(
+                extractor.aextract_structured_data("Report text", schema)
+            )
+
+            assert sync_result == async_result == {"title": "Report"}
+            assert (
+                mock_instance.complete_json.call_args
+                == mock_instance.acomplete_json.await_args
+            )
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_stream_structured_data_yields_completed_fields(self, mock_provider):
+        """Test that each field is yielded once the next one has started."""
+        mock_instance = Mock()
+        mock_instance.stream.return_value = iter(
+            ['{"title": "Report", "auth', 'ors": ["Ann", "Bo"], ', '"year": 2024}']
+        )
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            fields = extractor.stream_structured_data("Text", {"title": "string"})
+
+            assert next(fields) == ("title", "Report")
+            assert mock_instance.stream.call_count == 1
+            assert list(fields) == [("authors", ["Ann", "Bo"]), ("year", 2024)]
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_stream_structured_data_reports_truncated_response(self, mock_provider):
+        """Test that a cut-off stream keeps complete fields and reports the error."""
+        response = [
+            '{"title": "Report", "authors": ["Ann"], ',
+            '"year": 2024, "summary": "The report was trunc',
+        ]
+        mock_instance = Mock()
+        mock_instance.stream.return_value = iter(response)
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            fields = list(extractor.stream_structured_data("Text", {"title": "string"}))
+
+            assert fields == [
+                ("title", "Report"),
+                ("authors", ["Ann"]),
+                ("year", 2024),
+                ("error", "Failed to parse data"),
+                ("raw_response", "".join(response)),
+            ]
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_prompts_lead_with_document(self, mock_provider):
+        """Test that task prompts share the document as a common prefix."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = "{}"
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            extractor.summarize("Shared document")
+            extractor.analyze_sentiment("Shared document")
+
+            prompts = [c.args[0] for c in mock_instance.complete.call_args_list]
+            assert all(p.startswith("Text:\nShared document\n\n") for p in prompts)
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_batch_runs_calls_concurrently(self, mock_provider):
+        """Test that batch keeps call order and reports failures in place."""
+        mock_instance = Mock()
+        mock_instance.acomplete = AsyncMock(
+            side_effect=[
+                '{"overall_sentiment": "positive"}',
+                Exception("rate limited"),
+                "A short summary.",
+            ]
+        )
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai")
+            results = extractor.batch(
+                [
+                    ("analyze_sentiment", {"text": "Great!"}),
+                    ("extract_entities", {"text": "Jane"}),
+                    ("summarize", {"text": "Long text", "length": "short"}),
+                ],
+                max_parallel=1,
+            )
+
+        assert results[0] == {"overall_sentiment": "positive"}
+        assert isinstance(results[1], Exception)
+        assert results[2] == "A short summary."
+
+    def test_batch_rejects_unknown_method(self):
+        """Test that unsupported method names are rejected up front."""
+        extractor = TextExtractor(provider="openai", api_key="test-key")
+        with pytest.raises(ValueError):
+            extractor.batch([("multi_summarize", {"text": "Text"})])
+
+    @patch("src.text_extractor.OpenAIProvider")
+    def test_response_cache_skips_repeated_calls(self, mock_provider):
+        """Test that identical requests are served from the response cache."""
+        mock_instance = Mock()
+        mock_instance.complete.return_value = "This is a test summary."
+        mock_provider.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = TextExtractor(provider="openai", cache_size=8)
+            first = extractor.summarize("Long text here", length="short")
+            second = extractor.summarize("Long text here", length="short")
+            extractor.summarize("Long text here", length="long")
+
+            assert first == second == "This is a test summary."
+            assert mock_instance.complete.call_count == 2
+
+
+class TestProviders:
+    """Test cases for provider request building."""
+
+    def test_batch_twice_uses_a_client_per_event_loop(self):
+        """Test that each batch() loop gets its own async HTTP client."""
+        http_clients = []
+
+        with stub_async_http_clients("Summary.", http_clients):
+            extractor = TextExtractor(provider="openai", api_key="test-key")
+            calls = [("summarize", {"text": "First"}), ("summarize", {"text": "Second"})]
+
+            assert extractor.batch(calls) == ["Summary.", "Summary."]
+            assert extractor.batch(calls) == ["Summary.", "Summary."]
+
+        assert len(http_clients) == 2
+        assert all(client.is_closed for client in http_clients)
+
+    def test_anthropic_cached_prefix_marks_cache_control(self):
+        """Test that the static prefix becomes an ephemeral cache block."""
+        provider = AnthropicProvider(api_key="test-key")
+        kwargs = provider._build_kwargs(
+            "Resume:\nJane", 0.1, 500, None, cached_prefix="Instructions"
+        )
+
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "Instructions",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "Resume:\nJane"}]
+
+    def test_anthropic_complete_json_forces_tool_call(self):
+        """Test that JSON completions come from a forced tool call."""
+        provider = AnthropicProvider(api_key="test-key")
+        kwargs = provider._build_json_kwargs("Invoice", 0.1, 500, None)
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "record_result"}
+
+        response = Mock(content=[Mock(type="tool_use", input={"line_items": []})])
+        assert provider._tool_result(response) == '{"line_items":[]}'
+
+    def test_openai_complete_json_uses_json_mode(self):
+        """Test that JSON completions are JSON mode requests."""
+        provider = OpenAIProvider(api_key="test-key")
+        provider.client = Mock()
+        provider.client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content='{"line_items": []}'))]
+        )
+
+        assert provider.complete_json("Invoice", max_tokens=500) == '{"line_items": []}'
+        kwargs = provider.client.chat.completions.create.call_args.kwargs
+        assert kwargs["response_format"] == {"type": "json_object"}
+        assert kwargs["max_tokens"] == 500
+
+    def test_cached_provider_skips_high_temperature(self):
+        """Test that only low-temperature responses are served from cache."""
+        provider = Mock(model="test-model")
+        provider.complete.return_value = "response"
+        cached = CachedProvider(provider, ResponseCache(8))
+
+        cached.complete("prompt", temperature=0.1, max_tokens=100)
+        cached.complete("prompt", temperature=0.1, max_tokens=100)
+        cached.complete("prompt", temperature=0.7, max_tokens=100)
+        cached.complete("prompt", temperature=0.7, max_tokens=100)
+
+        assert provider.complete.call_count == 3
+        assert cached.model == "test-model"
+
+    def test_cached_provider_keys_on_exact_prompt(self):
+        """Test that prompts differing only in layout are cached separately."""
+        provider = Mock(model="test-model")
+        provider.complete.return_value = "response"
+        cached = CachedProvider(provider, ResponseCache(8))
+
+        cached.complete("Item  Qty\nPen   2\n", temperature=0.1)
+        cached.complete("Item Qty Pen 2", temperature=0.1)
+        cached.complete("Item Qty Pen 2", temperature=0.1)
+
+        assert provider.complete.call_count == 2
+
+    def test_cached_provider_normalize_whitespace_opt_in(self):
+        """Test that whitespace normalization shares entries when enabled."""
+        provider = Mock(model="test-model")
+        provider.complete.return_value = "response"
+        cached = CachedProvider(
+            provider, ResponseCache(8), normalize_whitespace=True
+        )
+
+        cached.complete("Text:\nHello   world\n", temperature=0.1)
+        cached.complete("Text: Hello world", temperature=0.1)
+        cached.complete("Text: Hello, world", temperature=0.1)
+
+        assert provider.complete.call_count == 2
+
+    def test_response_cache_expires_entries(self):
+        """Test that entries older than their TTL are treated as misses."""
+        cache = ResponseCache(8, ttl=60)
+        with patch("src.providers.cache.time.monotonic", return_value=0):
+            cache.set("key", "value")
+        with patch("src.providers.cache.time.monotonic", return_value=59):
+            assert cache.get("key") == "value"
+        with patch("src.providers.cache.time.monotonic", return_value=61):
+            assert cache.get("key") is None
+
 
 class TestInvoiceExtractor:
     """Test cases for InvoiceExtractor class."""
@@ -122,6 +566,64 @@ class TestInvoiceExtractor:
             assert result["invoice_number"] == "INV-001"
             assert result["total"] == 1000.00
 
+    @patch("src.extractors.invoice_extractor.TextExtractor")
+    def test_extract_batch_preserves_order(self, mock_extractor):
+        """Test that batch extraction returns results in input order."""
+        mock_instance = Mock()
+        mock_instance.provider.complete_json.return_value = (
+            '{"invoices": [{"invoice_number": "INV-1"}, '
+            '{"invoice_number": "INV-2"}, {"invoice_number": "INV-3"}]}'
+        )
+        mock_instance.temperature = 0.1
+        mock_extractor.return_value = mock_instance
+
+        extractor = InvoiceExtractor()
+        result = extractor.extract_batch(["INV-1", "INV-2", "INV-3"])
+
+        assert [r["invoice_number"] for r in result] == ["INV-1", "INV-2", "INV-3"]
+        assert mock_instance.provider.complete_json.call_count == 1
+        # Same sampling as extract(), which runs at the extractor's temperature
+        call = mock_instance.provider.complete_json.call_args
+        assert call.kwargs["temperature"] == 0.1
+        prompt = mock_instance.provider.complete_json.call_args.args[0]
+        assert prompt.startswith("INVOICE 0:\nINV-1\n\nINVOICE 1:\nINV-2")
+
+    @patch("src.extractors.invoice_extractor.TextExtractor")
+    def test_extract_batch_falls_back_per_invoice(self, mock_extractor):
+        """Test that a packed response with the wrong count is retried singly."""
+        mock_instance = Mock()
+        mock_instance.provider.complete_json.return_value = (
+            '{"invoices": [{"invoice_number": "INV-1"}]}'
+        )
+        mock_instance.extract_structured_data.side_effect = lambda text, schema: {
+            "invoice_number": text
+        }
+        mock_extractor.return_value = mock_instance
+
+        extractor = InvoiceExtractor()
+        result = extractor.extract_batch(["INV-1", "INV-2"])
+
+        assert [r["invoice_number"] for r in result] == ["INV-1", "INV-2"]
+        assert mock_instance.extract_structured_data.call_count == 2
+
+    def test_extract_line_items_unwraps_json_object(self):
+        """Test that line items are read from the JSON-mode object."""
+        text_extractor = Mock()
+        text_extractor.provider.complete_json.return_value = (
+            '{"line_items": [{"description": "Widget", "total": 10.0}]}'
+        )
+        extractor = InvoiceExtractor(extractor=text_extractor)
+
+        items = extractor.extract_line_items("Invoice text")
+
+        assert items == [{"description": "Widget", "total": 10.0}]
+
+    def test_accepts_preconstructed_extractor(self):
+        """Test that an injected TextExtractor is reused as-is."""
+        text_extractor = Mock()
+        extractor = InvoiceExtractor(extractor=text_extractor)
+        assert extractor.extractor is text_extractor
+
     def test_validate_invoice_valid(self):
         """Test validation of valid invoice data."""
         extractor = InvoiceExtractor()
@@ -147,10 +649,60 @@ class TestInvoiceExtractor:
         assert result["valid"] == False
         assert len(result["errors"]) > 0
 
+    def test_validate_invoice_subtotal_tolerance(self):
+        """Test that line item sums are compared to the subtotal within a cent."""
+        extractor = InvoiceExtractor(extractor=Mock())
+        invoice_data = {
+            "line_items": [{"total": 0.1}] * 500,
+            "subtotal": 50.0,
+        }
+        assert extractor.validate_invoice(invoice_data)["warnings"] == []
+
+        invoice_data["subtotal"] = 50.02
+        assert len(extractor.validate_invoice(invoice_data)["warnings"]) == 1
+
+    def test_validate_invoice_total_mismatch(self):
+        """Test that a total disagreeing with subtotal plus tax is an error."""
+        extractor = InvoiceExtractor(extractor=Mock())
+        invoice_data = {
+            "invoice_number": "INV-001",
+            "total": 1200.00,
+            "subtotal": 1000.00,
+            "tax": 100.00,
+            "vendor": {"name": "Test Vendor"},
+            "customer": "",
+        }
+
+        result = extractor.validate_invoice(invoice_data)
+        assert result["valid"] is False
+        assert result["errors"] == [
+            "Missing required field: customer",
+            "Total mismatch: calculated 1100.0, reported 1200.0",
+        ]
+
 
 class TestResumeExtractor:
     """Test cases for ResumeExtractor class."""
 
+    def test_contact_info_cap_fits_long_values(self):
+        """Test that a contact block with long names and URLs fits the cap."""
+        contact_info = {
+            "name": "Maria Alejandra Fernández-Castellanos de la Vega",
+            "email": "maria.fernandez-castellanos@university-hospital.example.org",
+            "phone": "+44 (0) 20 7946 0958 ext. 4412",
+            "location": "San Francisco Bay Area, California, United States",
+            "linkedin": "https://www.linkedin.com/in/maria-fernandez-castellanos-7a3b9c21/",
+            "github": "https://github.com/maria-alejandra-fernandez-castellanos",
+            "website": "https://www.fernandez-castellanos-research.example.com/papers/",
+        }
+
+        # Twice the estimate covers tokenizers that split URLs finely and
+        # the tool-call overhead of Anthropic's JSON responses
+        assert 2 * estimate_tokens(to_json(contact_info, indent=True)) <= (
+            _CONTACT_INFO_MAX_TOKENS
+        )
+        assert _CONTACT_INFO_MAX_TOKENS <= 500
+
     @patch("src.extractors.resume_extractor.TextExtractor")
     def test_extract_resume(self, mock_extractor):
         """Test resume data extraction."""
@@ -171,7 +723,7 @@ class TestResumeExtractor:
     def test_extract_contact_info(self, mock_extractor):
         """Test contact information extraction."""
         mock_instance = Mock()
-        mock_instance.provider.complete.return_value = """
+        mock_instance.provider.complete_json.return_value = """
         {
             "name": "John Doe",
             "email": "john@example.com",
@@ -191,7 +743,7 @@ class TestResumeExtractor:
     def test_extract_skills(self, mock_extractor):
         """Test skills extraction."""
         mock_instance = Mock()
-        mock_instance.provider.complete.return_value = """
+        mock_instance.provider.complete_json.return_value = """
         {
             "technical": ["Python", "JavaScript"],
             "languages": ["English", "Spanish"],
@@ -208,6 +760,95 @@ class TestResumeExtractor:
             assert "technical" in result
             assert "Python" in result["technical"]
 
+    def test_stream_match_job_description_yields_partial_results(self):
+        """Test that matching skills are reported while the response streams."""
+        mock_instance = Mock()
+        mock_instance.provider.stream.return_value = iter(
+            ['{"match_score": 80, "matching', '_skills": ["Python", ', '"SQL"]}']
+        )
+
+        extractor = ResumeExtractor(extractor=mock_instance)
+        results = list(extractor.stream_match_job_description("Resume", "Job"))
+
+        assert results == [
+            {"match_score": 80},
+            {"match_score": 80, "matching_skills": ["Python"]},
+            {"match_score": 80, "matching_skills": ["Python", "SQL"]},
+        ]
+
+    def test_stream_match_job_description_throttles_reparsing(self):
+        """Test that a long stream of small chunks is not re-parsed per chunk."""
+        skills = [f"skill{i}" for i in range(500)]
+        chunks = ['{"match_score": 80, "matching_skills": [']
+        chunks += [f'"{skill}", ' for skill in skills[:-1]]
+        chunks += [f'"{skills[-1]}"]}}']
+        mock_instance = Mock()
+        mock_instance.provider.stream.return_value = iter(chunks)
+
+        extractor = ResumeExtractor(extractor=mock_instance)
+        with patch(
+            "src.extractors.resume_extractor.parse_partial_json",
+            wraps=parse_partial_json,
+        ) as parse:
+            results = list(extractor.stream_match_job_description("Resume", "Job"))
+
+        assert results[-1] == {"match_score": 80, "matching_skills": skills}
+        assert parse.call_count < 50
+
+    @patch("src.extractors.resume_extractor.TextExtractor")
+    def test_aextract_full_gathers_contact_and_skills(self, mock_extractor):
+        """Test that the async full extraction combines both requests."""
+        mock_instance = Mock()
+        mock_instance.provider.acomplete_json = AsyncMock(
+            side_effect=['{"name": "John Doe"}', '{"technical": ["Python"]}']
+        )
+        mock_extractor.return_value = mock_instance
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            extractor = ResumeExtractor()
+            result = asyncio.run(extractor.aextract_full("Resume text"))
+
+            assert result["contact_info"]["name"] == "John Doe"
+            assert result["skills"]["technical"] == ["Python"]
+            assert mock_instance.provider.acomplete_json.await_count == 2
+
+    @patch("src.extractors.resume_extractor.TextExtractor")
+    def test_afull_analysis_summarizes_extracted_data(self, mock_extractor):
+        """Test that the summary is generated from the extracted data."""
+        mock_instance = Mock()
+        mock_instance.aextract_structured_data = AsyncMock(
+            return_value={"personal_info": {"name": "John Doe"}}
+        )
+        mock_instance.provider.acomplete_json = AsyncMock(
+            side_effect=['{"match_score": 80}', '{"technical": ["Python"]}']
+        )
+        mock_instance.provider.acomplete = AsyncMock(return_value="Summary.")
+        mock_extractor.return_value = mock_instance
+
+        extractor = ResumeExtractor()
+        result = extractor.full_analysis("Resume text", "Job description")
+
+        assert result["data"]["personal_info"]["name"] == "John Doe"
+        assert result["match"] == {"match_score": 80}
+        assert result["skills"] == {"technical": ["Python"]}
+        assert result["summary"] == "Summary."
+        summary_prompt = mock_instance.provider.acomplete.call_args.args[0]
+        assert "John Doe" in summary_prompt
+
+    def test_full_analysis_twice_uses_a_client_per_event_loop(self):
+        """Test that repeated full_analysis() calls do not share a closed loop."""
+        http_clients = []
+
+        with stub_async_http_clients('{"match_score": 80}', http_clients):
+            extractor = ResumeExtractor(provider="openai", api_key="test-key")
+            first = extractor.full_analysis("Resume text", "Job description")
+            second = extractor.full_analysis("Resume text", "Job description")
+
+        assert first == second
+        assert first["match"] == {"match_score": 80}
+        assert len(http_clients) == 2
+        assert all(client.is_closed for client in http_clients)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
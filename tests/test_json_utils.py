@@ -0,0 +1,59 @@
+"""
+Tests for JSON helpers.
+"""
+
+import json
+
+import pytest
+from src.utils.json_utils import parse_llm_json, parse_partial_json, to_json
+
+
+class TestParseLlmJson:
+    """Test cases for parse_llm_json."""
+
+    def test_bare_json(self):
+        """Test that a plain JSON response is parsed directly."""
+        assert parse_llm_json('{"name": "Jane"}') == {"name": "Jane"}
+
+    def test_fenced_json_with_prose(self):
+        """Test that fenced JSON is found inside surrounding prose."""
+        response = 'Here you go:\n```json\n[{"total": 1.5}]\n```\nDone.'
+        assert parse_llm_json(response, []) == [{"total": 1.5}]
+
+    def test_untagged_fence(self):
+        """Test that a fence without a language tag is handled."""
+        response = '```\n{"a": {"b": 1}}\n```'
+        assert parse_llm_json(response) == {"a": {"b": 1}}
+
+    def test_default_without_json(self):
+        """Test that the default is returned when no JSON is present."""
+        assert parse_llm_json("no json here", {}) == {}
+
+    def test_invalid_fenced_json_raises(self):
+        """Test that a malformed fenced block is reported as an error."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_llm_json("```json\n{invalid}\n```")
+
+    def test_round_trip(self):
+        """Test that to_json output parses back to the same value."""
+        data = {"name": "Café", "items": [1, 2.5, None]}
+        assert parse_llm_json(to_json(data)) == data
+
+
+class TestParsePartialJson:
+    """Test cases for parse_partial_json."""
+
+    def test_truncated_array_keeps_complete_items(self):
+        """Test that only fully received values are kept."""
+        text = '```json\n{"score": 80, "skills": ["Python", "SQ'
+        assert parse_partial_json(text) == {"score": 80, "skills": ["Python"]}
+
+    def test_nested_object_closed(self):
+        """Test that open brackets are closed after a completed object."""
+        text = '{"a": {"b": "x, y"}, "c": [{"d": 1}'
+        assert parse_partial_json(text) == {"a": {"b": "x, y"}, "c": [{"d": 1}]}
+
+    def test_nothing_complete(self):
+        """Test that None is returned before any value is complete."""
+        assert parse_partial_json('{"summary": "Strong') is None
+        assert parse_partial_json("Thinking...") is None
@@ -0,0 +1,202 @@
+"""
+Tests for text processing utilities.
+"""
+
+import pytest
+from src.utils.text_utils import (
+    calculate_readability_score,
+    count_syllables,
+    estimate_tokens,
+    extract_contacts,
+    extract_emails,
+    extract_phone_numbers,
+    extract_urls,
+    find_keywords,
+    get_reading_level,
+    prescan,
+    remove_special_characters,
+    split_into_chunks,
+    truncate_text,
+)
+
+
+class TestContactExtraction:
+    """Test cases for email, phone and URL extraction."""
+
+    def test_extract_emails(self):
+        """Test email extraction."""
+        text = "Contact sales@example.com or jane.doe@example.org today."
+        assert extract_emails(text) == ["sales@example.com", "jane.doe@example.org"]
+
+    def test_extract_phone_numbers(self):
+        """Test phone number extraction for common formats."""
+        text = "Call (555) 123-4567 or +1-415-555-0123."
+        phones = extract_phone_numbers(text)
+
+        assert phones == ["(555) 123-4567", "+1-415-555-0123"]
+
+    def test_extract_phone_numbers_deduplicates_in_order(self):
+        """Test that repeated numbers are reported once, in order of appearance."""
+        text = "Fax 555.123.4567, phone +1 (800) 555-1212, fax 555.123.4567."
+        assert extract_phone_numbers(text) == ["555.123.4567", "+1 (800) 555-1212"]
+
+    def test_extract_urls(self):
+        """Test URL extraction."""
+        text = "Visit https://example.com/docs and http://test.org."
+        assert extract_urls(text) == ["https://example.com/docs", "http://test.org."]
+
+    def test_extract_contacts(self):
+        """Test that extract_contacts matches the individual extractors."""
+        text = "Email sales@example.com, call (555) 123-4567, see https://example.com"
+        assert extract_contacts(text) == {
+            "emails": ["sales@example.com"],
+            "phone_numbers": ["(555) 123-4567"],
+            "urls": ["https://example.com"],
+        }
+
+
+class TestCountSyllables:
+    """Test cases for syllable counting."""
+
+    def test_count_syllables(self):
+        """Test vowel groups, silent e and the one-syllable minimum."""
+        assert count_syllables("Extraction") == 3
+        assert count_syllables("make") == 1
+        assert count_syllables("rhythm") == 1
+
+
+class TestEstimateTokens:
+    """Test cases for token count estimation."""
+
+    def test_estimate_tokens_rounds_up(self):
+        """Test that partial tokens count as a whole token."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestSplitIntoChunks:
+    """Test cases for chunking long text."""
+
+    def test_split_into_chunks_breaks_at_sentences(self):
+        """Test that chunks end at the last sentence boundary in the window."""
+        text = "First sentence. Second one here.\nThird line goes on and on"
+        chunks = split_into_chunks(text, max_length=40, overlap=5)
+
+        assert chunks[0] == "First sentence. Second one here.\n"
+        assert chunks[1].startswith("ere.\nThird")
+        assert text.endswith(chunks[-1])
+
+    def test_split_into_chunks_ignores_boundary_near_start(self):
+        """Test that an early boundary does not stall the chunker."""
+        text = "Version 1.2 release notes " + "word " * 1200
+        chunks = split_into_chunks(text)
+
+        assert chunks == [text[:4000], text[3800:]]
+
+    def test_split_into_chunks_progresses_with_large_overlap(self):
+        """Test that chunks advance when a boundary falls inside the overlap."""
+        text = "x" * 10 + ". " + "y" * 1000
+        chunks = split_into_chunks(text, max_length=300, overlap=200)
+
+        assert chunks[0] == text[:300]
+        assert all(len(chunk) <= 300 for chunk in chunks)
+        assert "".join(chunk[:100] for chunk in chunks[:-1]) + chunks[-1] == text
+
+
+class TestTruncateText:
+    """Test cases for text truncation."""
+
+    def test_truncate_text(self):
+        """Test truncation trims whitespace before the suffix."""
+        assert truncate_text("short", max_length=10) == "short"
+        assert truncate_text("  hello world again", max_length=13) == "hello wo..."
+        assert truncate_text("hello    world", max_length=10) == "hello..."
+
+    def test_truncate_text_suffix_longer_than_limit(self):
+        """Test that a suffix longer than max_length does not keep text."""
+        assert truncate_text("hello world", max_length=2) == "..."
+
+
+class TestRemoveSpecialCharacters:
+    """Test cases for special character removal."""
+
+    def test_remove_special_characters(self):
+        """Test that only ASCII letters, digits and optionally whitespace remain."""
+        text = "Café #1:\tnaïve\u00a0résumé!"
+        assert remove_special_characters(text) == "Caf 1\tnave\u00a0rsum"
+        assert remove_special_characters(text, keep_spaces=False) == "Caf1naversum"
+
+
+class TestFindKeywords:
+    """Test cases for keyword extraction."""
+
+    def test_find_keywords_orders_by_frequency(self):
+        """Test that keywords are ordered by frequency."""
+        text = "Data pipelines move data. Data quality matters for pipelines."
+        assert find_keywords(text, top_n=2) == ["data", "pipelines"]
+
+    def test_find_keywords_skips_stop_words(self):
+        """Test that stop words and short words are dropped."""
+        text = "The cat and the dog are in the garden"
+        keywords = find_keywords(text)
+
+        assert "the" not in keywords
+        assert "and" not in keywords
+        assert "garden" in keywords
+
+    def test_find_keywords_strips_punctuation_and_accents(self):
+        """Test that tokens keep only lowercase ASCII letters."""
+        text = "Café, CAFÉ and café! Data-driven data."
+        assert find_keywords(text, top_n=2) == ["caf", "datadriven"]
+
+    def test_find_keywords_repeat_calls_return_fresh_lists(self):
+        """Test that memoized results are not shared between callers."""
+        text = "Data pipelines move data. Data quality matters for pipelines."
+        first = find_keywords(text, top_n=2)
+        first.append("mutated")
+
+        assert find_keywords(text, top_n=2) == ["data", "pipelines"]
+
+
+class TestReadability:
+    """Test cases for readability scoring."""
+
+    def test_blank_text(self):
+        """Test that blank text scores zero without sharing the result dict."""
+        result = calculate_readability_score("  \n ")
+        assert result["word_count"] == 0
+        assert result["sentence_count"] == 0
+        assert result["reading_ease"] == 0
+        assert result["reading_level"] == "Very Difficult (College graduate)"
+
+        result["word_count"] = 5
+        assert calculate_readability_score("")["word_count"] == 0
+
+    def test_get_reading_level_boundaries(self):
+        """Test that each threshold belongs to the easier level."""
+        assert get_reading_level(95) == "Very Easy (5th grade)"
+        assert get_reading_level(90) == "Very Easy (5th grade)"
+        assert get_reading_level(89.99) == "Easy (6th grade)"
+        assert get_reading_level(60) == "Standard (8th-9th grade)"
+        assert get_reading_level(30) == "Difficult (College)"
+        assert get_reading_level(-10) == "Very Difficult (College graduate)"
+
+
+class TestPrescan:
+    """Test cases for the shared document prescan."""
+
+    def test_prescan_matches_uncached_results(self):
+        """Test that helpers return the same results with a prescan."""
+        text = "Sales grew fast. Sales teams cheered! Did the sales plan work?"
+        cache = prescan(text)
+
+        assert cache.sentence_count == 3
+        assert calculate_readability_score(text, cache=cache) == (
+            calculate_readability_score(text)
+        )
+        assert find_keywords(text, cache=cache) == find_keywords(text)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])